@@ -1,33 +1,44 @@
-import PyPDF2, json, math
+import json, math, os, heapq
 import itertools as itt
+from functools import partial
 from time import perf_counter
 from collections import defaultdict, namedtuple
 
 SwimmerTime = namedtuple("SwimmerTime", ["name", "time"])
 
-MEDLEY_RELAY_INDICES = [3, 4]
+MEDLEY_RELAY_INDICES = [3, 4, 7, 8]
 RELAY_EVENTS = [
     "4x50fr",
     "4x100fr",
     "4x200fr",
     "4x50mr",
     "4x100mr",
+    "4x50xfr",
+    "4x100xfr",
+    "4x50xmr",
+    "4x100xmr",
     ]
+SINGLE_GENDER_RELAY_EVENTS = RELAY_EVENTS[:5]
+# mixed relays have 2 men and 2 women, in any order
+MIXED_RELAY_EVENTS = RELAY_EVENTS[5:]
+SWIMMERS_PER_GENDER = 2
 
 MEDLEY_RELAY_INDIVIDUAL_EVENTS = {
     "4x50mr" : ["50ba", "50br", "50fl", "50fr"],
-    "4x100mr" : ["100ba", "100br", "100fl", "100fr"]
+    "4x100mr" : ["100ba", "100br", "100fl", "100fr"],
+    "4x50xmr" : ["50ba", "50br", "50fl", "50fr"],
+    "4x100xmr" : ["100ba", "100br", "100fl", "100fr"],
 }
 INDIVIDUAL_TO_RELAY_INDICES = {
-    "50fr" : [0, 3],
-    "100fr" : [1, 4],
+    "50fr" : [0, 3, 5, 7],
+    "100fr" : [1, 4, 6, 8],
     "200fr" : [2],
-    "50ba" : [3],
-    "100ba" : [4],
-    "50br" : [3],
-    "100br" : [4],
-    "50fl" : [3],
-    "100fl" : [4]
+    "50ba" : [3, 7],
+    "100ba" : [4, 8],
+    "50br" : [3, 7],
+    "100br" : [4, 8],
+    "50fl" : [3, 7],
+    "100fl" : [4, 8]
 }
 INDIVIDUAL_EVENTS = [
     "50fr",
@@ -44,6 +55,8 @@ FREE_RELAYS = {
     "4x50fr":"50fr",
     "4x100fr":"100fr",
     "4x200fr":"200fr",
+    "4x50xfr":"50fr",
+    "4x100xfr":"100fr",
 }
 RELAY_RECORDS_MEN = {
     "4x50fr":"1:14.08",
@@ -61,12 +74,23 @@ RELAY_RECORDS_WOMEN = {
     "4x100mr":"3:22.34",
 }
 
+# there are no NCAA mixed relays, so the base times are the average of the men's and women's records
+RELAY_RECORDS_MIXED = {
+    "4x50xfr":"1:19.28",
+    "4x100xfr":"2:55.61",
+    "4x50xmr":"1:26.47",
+    "4x100xmr":"3:10.78",
+}
+
 TEAM_NAMES = {
         0 : "A Team",
         1 : "B Team",
         2 : "C Team",
     }
 
+# verify every complete lineup found by the search, see ``verifier.verify_lineup``
+DEBUG = False
+
 def convert_time_to_seconds(time):
     '''
     Converts a time in the format "XX:XX.XX" to the number of seconds.
@@ -87,7 +111,10 @@ def calculate_points(event, swim_time, gender):
     Returns the points using Swimcloud's method and the NCAA records as base times:
     https://support.swimcloud.com/hc/en-us/articles/360052519314-How-are-performance-rankings-calculated-
     '''
-    base_time = RELAY_RECORDS_MEN[event] if gender == "male" else RELAY_RECORDS_WOMEN[event]
+    if event in RELAY_RECORDS_MIXED.keys():
+        base_time = RELAY_RECORDS_MIXED[event]
+    else:
+        base_time = RELAY_RECORDS_MEN[event] if gender == "male" else RELAY_RECORDS_WOMEN[event]
     base_time = convert_time_to_seconds(base_time)
     return round(1000 * math.pow(base_time/swim_time,3))
 
@@ -148,6 +175,9 @@ def read_pdf(file_name):
     '''
     Reads a pdf and returns the extracted text.
     '''
+    # PyPDF2 is slow to import and only needed when parsing pdfs
+    import PyPDF2
+
     text = ""
     with open(file_name, "rb") as pdfFileObj:
         pdfReader = PyPDF2.PdfReader(pdfFileObj)
@@ -237,47 +267,126 @@ def medley_relay_helper(rankings: list[list[SwimmerTime]],
                          ) -> list[list[SwimmerTime]]:
     '''
     Returns a list of possible medley relay teams that are selected greedily.
-    '''
-    new_team = team.copy()
-    # indices of relays each swimmer is apart of
-    name_count = defaultdict(list)
 
+    Whenever a swimmer is first for multiple legs, the team is branched once for each of
+    those legs with the swimmer removed from it. Branches are kept on an explicit stack.
+    Each entry is either a team to fill or the finish marker of a team whose branches are
+    still pending. A team with no possible branches is a possible team itself.
+    '''
     possible_teams = []
+    stack = [("fill", rankings, team, possible_teams)]
+
+    while len(stack) > 0:
+        entry = stack.pop()
+        if entry[0] == "finish":
+            _, new_team, branch_teams, parent_teams = entry
+            if len(branch_teams) == 0:
+                parent_teams.append(new_team)
+            else:
+                parent_teams += branch_teams
+            continue
 
-    for i, swimmer_time in enumerate(team):
-        stroke_rankings = rankings[i]
-        idx = 0
-        while idx < len(stroke_rankings) and stroke_rankings[idx].name in excluded_swimmers:
-            idx += 1
-        if idx == len(stroke_rankings):
-            return [new_team]
-        if swimmer_time is None:
-            if len(stroke_rankings) == 0:
-                return []
-            new_team[i] = stroke_rankings[idx]
-        name = new_team[i].name
-        name_count[name].append(i)
-
-    # TODO: this can be slightly optimized but it'll be very insignificant
-    for name in name_count.keys():
-        indices = name_count[name]
-        if len(indices) > 1:
-            # swimmer is first for multiple legs of the relay
-            temp_rankings = remove_swimmers_from_rankings(rankings, [name])
-            combinations = list(itt.combinations(indices, 1))
-            for combination in combinations:
-                temp_team = new_team.copy()
-                for index in combination:
+        _, rankings, team, parent_teams = entry
+        new_team = team.copy()
+        # indices of relays each swimmer is apart of
+        name_count = defaultdict(list)
+        filled = True
+
+        for i, swimmer_time in enumerate(team):
+            stroke_rankings = rankings[i]
+            idx = 0
+            while idx < len(stroke_rankings) and stroke_rankings[idx].name in excluded_swimmers:
+                idx += 1
+            if idx == len(stroke_rankings):
+                parent_teams.append(new_team)
+                filled = False
+                break
+            if swimmer_time is None:
+                new_team[i] = stroke_rankings[idx]
+            name = new_team[i].name
+            name_count[name].append(i)
+
+        if not filled:
+            continue
+
+        branches = []
+        for name in name_count.keys():
+            indices = name_count[name]
+            if len(indices) > 1:
+                # swimmer is first for multiple legs of the relay
+                temp_rankings = remove_swimmers_from_rankings(rankings, [name])
+                for index in indices:
+                    temp_team = new_team.copy()
                     temp_team[index] = None
-                possible_teams += medley_relay_helper(temp_rankings, temp_team, excluded_swimmers)
+                    branches.append((temp_rankings, temp_team))
 
-    if len(possible_teams) == 0:
-        possible_teams.append(new_team)
+        branch_teams = []
+        stack.append(("finish", new_team, branch_teams, parent_teams))
+        # pushed in reverse so branches are filled in order
+        for temp_rankings, temp_team in reversed(branches):
+            stack.append(("fill", temp_rankings, temp_team, branch_teams))
 
     return possible_teams
 
+def mixed_medley_relay_team(rankings: list[list[SwimmerTime]],
+                            excluded_swimmers: list[str],
+                            swimmer_genders: dict[str, str]
+                            ) -> list[SwimmerTime]:
+    '''
+    Returns the fastest medley relay team with ``SWIMMERS_PER_GENDER`` swimmers of each gender,
+    or ``None`` if there aren't enough swimmers.
+
+    Every split of the legs between genders is tried. Since the genders can't share swimmers, each
+    gender's legs are filled independently, and only the fastest ``SWIMMERS_PER_GENDER`` swimmers
+    of a gender in each stroke can be part of the fastest fill.
+    '''
+    candidates = []
+    for stroke_rankings in rankings:
+        stroke_candidates = defaultdict(list)
+        for swimmer_time in stroke_rankings:
+            name = swimmer_time.name
+            if name in excluded_swimmers:
+                continue
+            gender_candidates = stroke_candidates[swimmer_genders[name]]
+            if len(gender_candidates) < SWIMMERS_PER_GENDER:
+                gender_candidates.append(swimmer_time)
+        candidates.append(stroke_candidates)
+
+    best_time = 0
+    best_team = None
+    for male_legs in itt.combinations(range(4), SWIMMERS_PER_GENDER):
+        female_legs = [i for i in range(4) if i not in male_legs]
+        team = [None, None, None, None]
+        total_time = 0
+        for gender, legs in (("male", male_legs), ("female", female_legs)):
+            best_fill_time = 0
+            best_fill = None
+            for fill in itt.product(*[candidates[leg][gender] for leg in legs]):
+                if len(set(swimmer_time.name for swimmer_time in fill)) < len(fill):
+                    continue
+                fill_time = sum(swimmer_time.time for swimmer_time in fill)
+                if best_fill is None or fill_time < best_fill_time:
+                    best_fill = fill
+                    best_fill_time = fill_time
+            if best_fill is None:
+                break
+            for leg, swimmer_time in zip(legs, best_fill):
+                team[leg] = swimmer_time
+            total_time += best_fill_time
+        if None in team:
+            continue
+        if best_team is None or total_time < best_time:
+            best_team = team
+            best_time = total_time
+
+    return best_team
+
 def medley_relay_team(rankings: list[list[SwimmerTime]],
-                      excluded_swimmers: list[str]):
+                      excluded_swimmers: list[str],
+                      swimmer_genders: dict[str, str] = None):
+    if swimmer_genders is not None:
+        return mixed_medley_relay_team(rankings, excluded_swimmers, swimmer_genders)
+
     possible_teams = medley_relay_helper(rankings, [None, None, None, None], excluded_swimmers)
 
     best_time = 0
@@ -298,7 +407,8 @@ def medley_relay_team(rankings: list[list[SwimmerTime]],
 def free_relay_team(
         rankings: list[SwimmerTime], 
         team: list[SwimmerTime],
-        excluded_swimmers : list[str]
+        excluded_swimmers : list[str],
+        swimmer_genders: dict[str, str] = None
     ) -> list[tuple[str, str]]:
     '''
     Returns the best free relay team for an event.
@@ -309,6 +419,11 @@ def free_relay_team(
         An ordered array of tuples, each tuple containing the full name of the swimmer
         along with their time. See extract_rankings for more details.
 
+    swimmer_genders : dict, optional
+        key : swimmer name
+        value : the swimmer's gender
+        If given, the team is filled as a mixed relay with ``SWIMMERS_PER_GENDER`` swimmers of each gender.
+
     Returns
     -------
     teams : array of tuples
@@ -317,10 +432,13 @@ def free_relay_team(
     '''
 
     names = []
+    gender_counts = defaultdict(int)
     for swimmer_time in team:
         if swimmer_time is None:
             continue
         names.append(swimmer_time.name)
+        if swimmer_genders is not None:
+            gender_counts[swimmer_genders[swimmer_time.name]] += 1
             
     curr_team = team.copy()
     idx = 0
@@ -332,11 +450,16 @@ def free_relay_team(
             if name in names or name in excluded_swimmers:
                 idx += 1
                 continue
+            if swimmer_genders is not None and gender_counts[swimmer_genders[name]] == SWIMMERS_PER_GENDER:
+                idx += 1
+                continue
             break
         if idx == len(rankings):
             break
         curr_team[i] = rankings[idx]
         names.append(rankings[idx].name)
+        if swimmer_genders is not None:
+            gender_counts[swimmer_genders[rankings[idx].name]] += 1
         idx += 1
     return curr_team
 
@@ -347,21 +470,8 @@ def get_swimmer_combinations(
     is an array of indices of the relays that the swimmer at 
     event_combinations.keys()[i] can swim.
     '''
-    all_combinations = []
     names = list(event_combinations.keys())
-
-    def helper(idx, combination: list[list[int]]):
-        if idx == len(names):
-            all_combinations.append(combination)
-            return
-        name = names[idx]
-        combinations = event_combinations[name]
-        for c in combinations:
-            helper(idx + 1, combination + [c])
-
-    helper(0, [])
-
-    return all_combinations
+    return [list(combination) for combination in itt.product(*[event_combinations[name] for name in names])]
 
 def generate_lineup(
         all_rankings: dict[str, list[SwimmerTime]], 
@@ -370,7 +480,8 @@ def generate_lineup(
         relay_teams: dict[str, list[SwimmerTime]],
         swimmer_event_limits: dict[str, int],
         previous_assigned_events: dict[str, list[int]],
-        relays_per_swimmer: int
+        relays_per_swimmer: int,
+        swimmer_genders: dict[str, str] = None
                             ) -> tuple[
                                 dict[str, list[int]], 
                                 dict[str, list[SwimmerTime]]
@@ -384,6 +495,11 @@ def generate_lineup(
         key : event name
         value : array of tuples with rankings
         A dictionary of rankings for each event. See extract_rankings for more details.
+
+    swimmer_genders : dict, optional
+        key : swimmer name
+        value : the swimmer's gender
+        Required if ``relay_teams`` has mixed relays.
     
     Returns
     -------
@@ -408,8 +524,8 @@ def generate_lineup(
         swimmer_events[name] = combination[i].copy()
 
     # copy relay groups and removing swimmers from events that aren't in their combination
-    event_idx = 0
     for event, team in relay_teams.items():
+        event_idx = RELAY_EVENTS.index(event)
         tc = team.copy()
         for i, swimmer_time in enumerate(team):
             if swimmer_time is None:
@@ -418,13 +534,14 @@ def generate_lineup(
             if event_idx not in swimmer_events[name]:
                 tc[i] = None
         curr_relay_teams[event] = tc
-        event_idx += 1
 
     limited_swimmers_with_mr = {}
 
     # reset medley relays with <4 people in it
     for mr_idx in MEDLEY_RELAY_INDICES:
         event = RELAY_EVENTS[mr_idx]
+        if event not in relay_teams:
+            continue
         team = curr_relay_teams[event]
         if None not in team:
             # team is filled with swimmers
@@ -450,9 +567,11 @@ def generate_lineup(
     all_rankings = remove_swimmers_from_all_rankings(all_rankings, maxed_swimmers)
 
     for event_index, relay_name in enumerate(RELAY_EVENTS):
-        # if relay team is already filled, skip
-        if None not in curr_relay_teams[relay_name]:
+        # if relay team is already filled or the relay isn't being swum, skip
+        if relay_name not in relay_teams or None not in curr_relay_teams[relay_name]:
             continue
+
+        relay_genders = swimmer_genders if relay_name in MIXED_RELAY_EVENTS else None
         
         excluded_swimmers = []
         for name, events in limited_swimmers_with_mr.items():
@@ -469,7 +588,7 @@ def generate_lineup(
             individual_event_name = FREE_RELAYS[relay_name]
             rankings = all_rankings[individual_event_name]
 
-            relay_team = free_relay_team(rankings, team, excluded_swimmers)
+            relay_team = free_relay_team(rankings, team, excluded_swimmers, relay_genders)
 
             if None in relay_team:
                 # not enough swimmers to fill freestyle relay
@@ -489,7 +608,7 @@ def generate_lineup(
                 rankings = all_rankings[individual_event]
                 medley_rankings.append(rankings)
             
-            relay_team = medley_relay_team(medley_rankings, excluded_swimmers)
+            relay_team = medley_relay_team(medley_rankings, excluded_swimmers, relay_genders)
 
             if relay_team is None:
                 return None, None
@@ -503,28 +622,181 @@ def generate_lineup(
     return swimmer_events, curr_relay_teams
 
 
-def generate_all_lineups(
-        prev_event_combinations: dict[str, list[list[int]]], 
+def event_combinations_key(event_combinations: dict[str, list[list[int]]]) -> frozenset:
+    '''
+    Returns a hashable key that is equal for equal ``event_combinations``.
+    '''
+    return frozenset((name, tuple(tuple(events) for events in combinations)) 
+                     for name, combinations in event_combinations.items())
+
+def relay_ideal_times(rankings: dict[str, list[SwimmerTime]], 
+                      relay_events: list[str]) -> dict[str, float]:
+    '''
+    Returns the time of each relay if every leg was swum by the fastest swimmer(s) for the leg,
+    ignoring relay limits.
+    '''
+    ideal_times = {}
+    for relay_name in relay_events:
+        if relay_name in FREE_RELAYS.keys():
+            stroke_rankings = rankings[FREE_RELAYS[relay_name]]
+            ideal_time = sum(swimmer_time.time for swimmer_time in stroke_rankings[:4])
+        else:
+            ideal_time = 0
+            for individual_event in MEDLEY_RELAY_INDIVIDUAL_EVENTS[relay_name]:
+                stroke_rankings = rankings[individual_event]
+                if len(stroke_rankings) > 0:
+                    ideal_time += stroke_rankings[0].time
+        ideal_times[relay_name] = ideal_time
+    return ideal_times
+
+def lineup_priority(relay_teams: dict[str, list[SwimmerTime]], 
+                    ideal_times: dict[str, float],
+                    relays_per_swimmer: int,
+                    swimmer_event_limits: dict[str, int]) -> tuple[int, float]:
+    '''
+    Returns the priority of a lineup in a best-first search. Lower is better.
+
+    Lineups with fewer relays over the swimmers' limits need fewer cuts to become valid, so they
+    come first. Lineups with the same number of extra relays are ordered by how far they are from
+    the ideal relay times, since cutting swimmers down to their limits can only slow relays down.
+    '''
+    swimmer_relays = defaultdict(int)
+    for relay_team in relay_teams.values():
+        for swimmer_time in relay_team:
+            swimmer_relays[swimmer_time.name] += 1
+    extra_relays = 0
+    for name, relays in swimmer_relays.items():
+        limit = swimmer_event_limits[name] if name in swimmer_event_limits.keys() else relays_per_swimmer
+        extra_relays += max(relays - limit, 0)
+
+    distance = 0
+    for relay_name, relay_team in relay_teams.items():
+        if ideal_times[relay_name] == 0:
+            continue
+        total_time = 0
+        for swimmer_time in relay_team:
+            total_time += swimmer_time.time
+        distance += total_time / ideal_times[relay_name]
+    return extra_relays, distance
+
+def evaluate_combination(
+        rankings: dict[str, list[SwimmerTime]],
+        names: list[str],
+        combination: list[list[int]],
         prev_relay_teams: dict[str, list[SwimmerTime]],
+        relays_per_swimmer: int, 
+        top_events: dict[str, int], 
+        swimmer_event_limits: dict[str, int], 
+        previous_assigned_events: dict[str, list[int]],
+        swimmer_genders: dict[str, str]
+        ) -> tuple[tuple[dict[str, list[int]], dict[str, list[SwimmerTime]]],
+                   dict[str, list[list[int]]],
+                   dict[str, list[SwimmerTime]]]:
+    '''
+    Generates the lineup for one combination of relays for the swimmers in ``names``.
+
+    Returns
+    -------
+    lineup : tuple
+        The lineup in the format (swimmer_events, relay_groups) returned by ``generate_lineup``
+        if it is complete and within every swimmer's relay limit, otherwise ``None``.
+
+    event_combinations : dict
+        The combinations of relays to search next if a swimmer exceeded their relay limit,
+        otherwise ``None``. See ``generate_event_combinations``.
+
+    relay_teams : dict
+        The relay teams generated for the combination.
+    '''
+    swimmer_events, relay_teams = generate_lineup(
+        rankings, names, combination, 
+        prev_relay_teams, swimmer_event_limits, previous_assigned_events,
+        relays_per_swimmer, swimmer_genders)
+
+    if swimmer_events is None:
+        # not enough swimmers for one of the relays, skip this combination
+        return None, None, None
+
+    # Check if lineup is optimal:
+    # if a top swimmer is not swimming their minimum number of events, the lineup is not optimal
+    for name, minimum_events in top_events.items():
+        if name not in swimmer_events:
+            return None, None, None
+        current_number_of_events = len(swimmer_events[name])
+        if current_number_of_events < minimum_events:
+            return None, None, None
+
+    swimmer_exceeded_limit, event_combinations = generate_event_combinations(
+        swimmer_events, relays_per_swimmer, swimmer_event_limits)
+
+    if not swimmer_exceeded_limit:
+        if DEBUG:
+            from verifier import assert_valid_lineup
+            assert_valid_lineup({"": relay_teams}, relays_per_swimmer, rankings,
+                                swimmer_event_limits, previous_assigned_events, swimmer_genders)
+        return (swimmer_events, relay_teams), None, relay_teams
+
+    # At least one swimmer is signed up to swim more than ``relays_per_swimmer`` relays.
+    # for swimmers who have events locked in, add them back in 
+    for i, name in enumerate(names):
+        events = combination[i]
+        if name not in event_combinations.keys():
+            event_combinations[name] = [events]
+
+    return None, event_combinations, relay_teams
+
+def load_search_checkpoint(checkpoint_file: str, inputs: tuple) -> dict:
+    '''
+    Returns the search state saved in ``checkpoint_file``, or ``None`` if there is no checkpoint.
+    '''
+    if checkpoint_file is None or not os.path.exists(checkpoint_file):
+        return None
+    import pickle
+    with open(checkpoint_file, "rb") as f:
+        state = pickle.load(f)
+    if state["inputs"] != inputs:
+        raise ValueError(f"{checkpoint_file} is a checkpoint for a different search.")
+    return state
+
+def save_search_checkpoint(checkpoint_file: str, state: dict):
+    '''
+    Saves the search state to ``checkpoint_file``, replacing any previous checkpoint.
+    '''
+    import pickle
+    temp_file = checkpoint_file + ".tmp"
+    with open(temp_file, "wb") as f:
+        pickle.dump(state, f)
+    os.replace(temp_file, checkpoint_file)
+
+SEARCH_ORDERINGS = ["dfs", "best_first"]
+
+def generate_all_lineups(
+        relay_teams: dict[str, list[SwimmerTime]],
         rankings: dict[str, list[SwimmerTime]],
         relays_per_swimmer: int, 
-        top_events, 
+        top_events: dict[str, int], 
         swimmer_event_limits: dict[str, int], 
-        all_event_combinations: list[dict[str, list[list[int]]]],
-        previous_assigned_events: dict[str, list[int]]
-        ) -> list[tuple[dict[str, list[int]], 
-                  dict[str, list[SwimmerTime]]]]:
+        previous_assigned_events: dict[str, list[int]],
+        swimmer_genders: dict[str, str] = None,
+        ordering: str = "dfs",
+        node_limit: int = None,
+        checkpoint_file: str = None
+        ) -> tuple[list[tuple[dict[str, list[int]], 
+                        dict[str, list[SwimmerTime]]]], bool]:
     '''
     Returns a list of all possible lineups.
 
+    The search starts from the greedy lineup. Whenever a lineup has swimmers over their relay limit,
+    every way of cutting those swimmers down to their limit is searched, refilling the relays they
+    leave. Each set of ways is a node on the search frontier, which holds the node's combinations
+    still to be tried.
+
     Parameters
     ----------
-    prev_event_combinations : dict
-        key : swimmer name
-        value : 2-d array of ints
-            Each sub-array contains the indices of the relays that a swimmer can take part in and
-            is restricted to a length of ``relays_per_swimmer``. Each sub-array represents a possible
-            lineup for the relays that the swimmer can take part in.
+    relay_teams : dict
+        key : event
+        value : array of 4 swimmers, all ``None``
+        The relays to find lineups for.
     
     rankings : dict
         key : event name
@@ -534,81 +806,124 @@ def generate_all_lineups(
     relays_per_swimmer : int
         The maximum number of relays each swimmer can swim.
 
-    relays_per_event : int
-        The number of relay teams for each event.
-
-    Returns
-    -------
-    lineups : arr
-        An array of tuples. Each tuple has the format of (swimmer_events, relay_groups) returned by ``generate_lineup``.
-    '''
-    
-    # ``forbidden_swimmer_arrays`` is a 2-d array of arrays, each called ``forbidden_events``
-    # Every ``forbidden_events`` is an array with the same length as ``EVENTS``. If the ``i``th index
-    # of ``forbidden_events`` is the swimmer's name, then the swimmer cannot swim the ``i``th event.
-
-    current_combinations = get_swimmer_combinations(prev_event_combinations)
-    
-    lineups = []
-
-    names = list(prev_event_combinations.keys())
-
-    if len(names) == 0:
-        current_combinations.append([])
-
-    for curr_combination in current_combinations:
-        swimmer_events, relay_teams = generate_lineup(
-            rankings, names, curr_combination, 
-            prev_relay_teams, swimmer_event_limits, previous_assigned_events,
-            relays_per_swimmer)
+    top_events : dict
+        key : swimmer name
+        value : the minimum number of relays the swimmer swims in an optimal lineup
+        See ``swimmer_minimum_events``.
 
-        if swimmer_events is None:
-            # not enough swimmers for one of the relays, skip this combination
-            continue
+    swimmer_genders : dict, optional
+        key : swimmer name
+        value : the swimmer's gender
+        Required if ``relay_teams`` has mixed relays.
 
-        not_optimal = False
-        # Check if lineup is optimal:
-        # if a top swimmer is not swimming their minimum number of events, the lineup is not optimal
-        for name, minimum_events in top_events.items():
-            if name not in swimmer_events:
-                not_optimal = True
-                break
-            current_number_of_events = len(swimmer_events[name])
-            if current_number_of_events < minimum_events:
-                not_optimal = True
-                break
+    ordering : str
+        "dfs" tries each node's combinations depth first, in the same order as a recursive search.
+        "best_first" always continues from the node whose lineup has the fewest relays over the
+        swimmers' limits, then the one closest to the ideal relay times. See ``lineup_priority``.
 
-        if not_optimal:
-            continue
+    node_limit : int, optional
+        The maximum number of combinations to try in this call. If the limit is reached, the search
+        stops early and returns the lineups found so far.
 
-        swimmer_exceeded_limit, event_combinations = generate_event_combinations(
-            swimmer_events, relays_per_swimmer, swimmer_event_limits)
+    checkpoint_file : str, optional
+        If given, the search state is saved to this file when the search stops, is interrupted or
+        finishes. If the file already exists, the search resumes from it.
 
-        if swimmer_exceeded_limit:
-            # At least one swimmer is signed up to swim more than ``relays_per_swimmer`` relays.\
+    Returns
+    -------
+    lineups : arr
+        An array of tuples. Each tuple has the format of (swimmer_events, relay_groups) returned by ``generate_lineup``.
+        Lineups are in the order a depth first search finds them, whatever the ``ordering``.
 
-            # for swimmers who have events locked in, add them back in 
-            for i, name in enumerate(names):
-                events = curr_combination[i]
-                if name not in event_combinations.keys():
-                    event_combinations[name] = [events]
+    finished : bool
+        ``False`` if the search stopped at ``node_limit`` before trying every combination.
+    '''
+    if ordering not in SEARCH_ORDERINGS:
+        raise ValueError(f"Unknown search ordering {ordering}.")
+
+    inputs = (relay_teams, rankings, relays_per_swimmer, top_events, swimmer_event_limits,
+              previous_assigned_events, swimmer_genders, ordering)
+    state = load_search_checkpoint(checkpoint_file, inputs)
+    if state is None:
+        # each frame is [names, combinations, index of the next combination to try, relay teams,
+        # the index of the combination that led to the frame in each of its ancestors]
+        root = [[], get_swimmer_combinations({}), 0, relay_teams, ()]
+        state = {
+            "inputs": inputs,
+            "frontier": [root] if ordering == "dfs" else [((0, 0), 0, root)],
+            "seen": set(),
+            "lineups": [],
+            "paths": [],
+            "frames": 1,
+        }
 
-            # checks if current combination has been tried before
-            if event_combinations in all_event_combinations:
+    frontier = state["frontier"]
+    seen = state["seen"]
+    lineups = state["lineups"]
+    paths = state["paths"]
+    ideal_times = relay_ideal_times(rankings, relay_teams.keys()) if ordering == "best_first" else None
+    nodes = 0
+
+    try:
+        while len(frontier) > 0:
+            frame = frontier[-1] if ordering == "dfs" else frontier[0][2]
+            names, combinations, index, prev_relay_teams, path = frame
+
+            if index == len(combinations):
+                if ordering == "dfs":
+                    frontier.pop()
+                else:
+                    heapq.heappop(frontier)
                 continue
 
-            all_event_combinations.append(event_combinations)
-
-            generated_lineups = generate_all_lineups(
-                event_combinations, relay_teams, rankings, relays_per_swimmer, 
-                top_events, swimmer_event_limits, all_event_combinations,
-                previous_assigned_events)
-
-            lineups += generated_lineups
-        else:
-            lineups.append((swimmer_events, relay_teams))
-    
-    return lineups
+            if node_limit is not None and nodes >= node_limit:
+                break
+            nodes += 1
+
+            lineup, event_combinations, curr_relay_teams = evaluate_combination(
+                rankings, names, combinations[index], prev_relay_teams, relays_per_swimmer,
+                top_events, swimmer_event_limits, previous_assigned_events, swimmer_genders)
+
+            if lineup is not None:
+                lineups.append(lineup)
+                if ordering == "best_first":
+                    paths.append(path + (index,))
+            elif event_combinations is not None:
+                # checks if current combination has been tried before
+                key = event_combinations_key(event_combinations)
+                if key not in seen:
+                    child = [list(event_combinations.keys()), get_swimmer_combinations(event_combinations), 
+                             0, curr_relay_teams, path + (index,)]
+                    if ordering == "dfs":
+                        frontier.append(child)
+                    else:
+                        priority = lineup_priority(curr_relay_teams, ideal_times, 
+                                                   relays_per_swimmer, swimmer_event_limits)
+                        heapq.heappush(frontier, (priority, state["frames"], child))
+                    state["frames"] += 1
+                    seen.add(key)
+
+            frame[2] += 1
+    except KeyboardInterrupt:
+        if checkpoint_file is not None:
+            save_search_checkpoint(checkpoint_file, state)
+        raise
+
+    if checkpoint_file is not None:
+        save_search_checkpoint(checkpoint_file, state)
+
+    if ordering == "best_first":
+        # a depth first search finds lineups in the order of their paths, so sorting by path
+        # returns them in the same order and ties in points are broken the same way
+        order = sorted(range(len(lineups)), key=lambda i: paths[i])
+        lineups = [lineups[i] for i in order]
+    return lineups, len(frontier) == 0
+
+# search engines that can be passed to ``solve_lineup``, all with the signature of ``generate_all_lineups``
+SEARCH_ENGINES = {
+    "dfs": partial(generate_all_lineups, ordering="dfs"),
+    "best_first": partial(generate_all_lineups, ordering="best_first"),
+}
 
 def write_rankings(rankings):
     with open('rankings.txt','w') as f:
@@ -635,7 +950,7 @@ def get_fastest_lineup(lineups, gender):
             if total_time == 0:
                 continue
             total_points += calculate_points(event, total_time, gender)
-        total_points /= len(RELAY_EVENTS)
+        total_points /= len(relay_teams)
 
         if best is None or total_points > best_points:
             best = lineup
@@ -645,19 +960,37 @@ def get_fastest_lineup(lineups, gender):
 
 def swimmer_minimum_events(all_rankings: dict[str, list[SwimmerTime]],
                            relays_per_swimmer: int, 
-                           previous_assigned_events):
+                           previous_assigned_events,
+                           swimmer_event_limits: dict[str, int] = None,
+                           relay_events: list[str] = SINGLE_GENDER_RELAY_EVENTS,
+                           swimmer_genders: dict[str, str] = None):
     '''
     Finds the minimum number of events that certain swimmers should swim.
     '''
-    top_swimmers = {}
+    if swimmer_event_limits is None:
+        swimmer_event_limits = {}
 
-    mr_50 = ["50fr", "50ba", "50br", "50fl"]
-    mr_100 = ["100fr","100ba","100br","100fl"]
+    top_swimmers = {}
 
-    for i, event in enumerate(RELAY_EVENTS):
-        if event[-2:] == "mr":
-            individual_events = mr_50 if event == "4x50mr" else mr_100
-            for individual_event in individual_events:
+    for event in relay_events:
+        i = RELAY_EVENTS.index(event)
+        if event in MIXED_RELAY_EVENTS and event in MEDLEY_RELAY_INDIVIDUAL_EVENTS.keys():
+            # the fastest swimmer in each stroke might not fit the gender split,
+            # so count the swimmers on the fastest mixed team instead
+            excluded_swimmers = [name for name, events in previous_assigned_events.items() if i in events]
+            medley_rankings = [all_rankings[individual_event] 
+                               for individual_event in MEDLEY_RELAY_INDIVIDUAL_EVENTS[event]]
+            relay_team = mixed_medley_relay_team(medley_rankings, excluded_swimmers, swimmer_genders)
+            if relay_team is None:
+                continue
+            for swimmer_time in relay_team:
+                name = swimmer_time.name
+                if name not in top_swimmers.keys():
+                    top_swimmers[name] = 1
+                else:
+                    top_swimmers[name] += 1
+        elif event in MEDLEY_RELAY_INDIVIDUAL_EVENTS.keys():
+            for individual_event in MEDLEY_RELAY_INDIVIDUAL_EVENTS[event]:
                 rankings = all_rankings[individual_event]
                 for swimmer_time in rankings:
                     name = swimmer_time.name
@@ -673,6 +1006,7 @@ def swimmer_minimum_events(all_rankings: dict[str, list[SwimmerTime]],
             individual_event = FREE_RELAYS[event]
             rankings = all_rankings[individual_event]
             swimmers_added = 0
+            gender_counts = defaultdict(int)
             for swimmer_time in rankings:
                 if swimmers_added == 4:
                     break
@@ -680,6 +1014,11 @@ def swimmer_minimum_events(all_rankings: dict[str, list[SwimmerTime]],
                 if name in previous_assigned_events and i in previous_assigned_events[name]:
                     # swimmer already swimming this event
                     continue
+                if event in MIXED_RELAY_EVENTS:
+                    gender = swimmer_genders[name]
+                    if gender_counts[gender] == SWIMMERS_PER_GENDER:
+                        continue
+                    gender_counts[gender] += 1
                 if name not in top_swimmers.keys():
                     top_swimmers[name] = 1
                 else:
@@ -693,16 +1032,29 @@ def swimmer_minimum_events(all_rankings: dict[str, list[SwimmerTime]],
         if name in previous_assigned_events.keys():
             event_lineup = previous_assigned_events[name]
             limit -=  len(event_lineup)
+        if name in swimmer_event_limits.keys():
+            limit = min(limit, swimmer_event_limits[name])
         top_swimmers[name] = min(events, limit)
 
     return top_swimmers
 
-def extract_all_rankings(school_name, gender) -> dict[str, list[SwimmerTime]]:
+def top_times_file(school_name: str, gender: str, event: str, directory: str = "times") -> str:
+    '''
+    Returns the path of the top times pdf for ``event``.
+    '''
+    return os.path.join(directory, gender, f"{school_name} - Top Times - {event}.pdf")
+
+def extract_all_rankings(school_name, gender, write=True, directory="times") -> dict[str, list[SwimmerTime]]:
+    '''
+    Parses the top times pdf for every individual event. The rankings are also written to
+    rankings.txt unless ``write`` is ``False``.
+    '''
     all_rankings = {}
     for event in INDIVIDUAL_EVENTS:
-        all_rankings[event] = extract_rankings(f"times/{gender}/{school_name} - Top Times - {event}.pdf", school_name)
+        all_rankings[event] = extract_rankings(top_times_file(school_name, gender, event, directory), school_name)
 
-    write_rankings(all_rankings)
+    if write:
+        write_rankings(all_rankings)
     return all_rankings
 
 def remove_swimmers_from_all_rankings(rankings, excluded_swimmers):
@@ -717,20 +1069,94 @@ def remove_swimmers_from_all_rankings(rankings, excluded_swimmers):
     
     return modified_rankings
 
-def generate_best_lineup(teams_per_event, relays_per_swimmer, school_name, gender):
+def solve_lineup(all_rankings: dict[str, list[SwimmerTime]],
+                 teams_per_event: int,
+                 relays_per_swimmer: int,
+                 gender: str,
+                 swimmer_relay_caps: dict[str, int] = None,
+                 engine: str = "dfs",
+                 relay_events: list[str] = SINGLE_GENDER_RELAY_EVENTS,
+                 swimmer_genders: dict[str, str] = None,
+                 node_limit: int = None,
+                 checkpoint_file: str = None
+                 ) -> tuple[dict, dict[str, list[int]], dict[str, bool]]:
+    '''
+    Finds the best lineup for each team, from the A team down.
+
+    Parameters
+    ----------
+    all_rankings : dict
+        key : event name
+        value : array of tuples with rankings
+        A dictionary of rankings for each event. See extract_rankings for more details.
+
+    teams_per_event : int
+        The number of relay teams for each event.
+
+    relays_per_swimmer : int
+        The maximum number of relays each swimmer can swim.
+
+    swimmer_relay_caps : dict, optional
+        key : swimmer name
+        value : the maximum number of relays the swimmer can swim, if lower than ``relays_per_swimmer``
+        Swimmers with a cap of 0 are left out of the lineup.
+
+    engine : str
+        The name of the search engine in ``SEARCH_ENGINES`` used to find each team's lineups.
+
+    relay_events : arr of str
+        The relays in the lineup. Defaults to the single-gender relays.
+
+    swimmer_genders : dict, optional
+        key : swimmer name
+        value : the swimmer's gender
+        Required if ``relay_events`` has mixed relays. See ``solve_mixed_lineup``.
+
+    node_limit : int, optional
+        The maximum number of combinations each team's search tries. If a search stops early,
+        the best lineup it found is used.
+
+    checkpoint_file : str, optional
+        If given, each team's search is checkpointed to this file with the team's index appended.
+        If a search stops early, the solve stops after that team, and calling ``solve_lineup``
+        again with the same arguments resumes it. See ``generate_all_lineups``.
+
+    Returns
+    -------
+    complete_lineup : dict
+        The lineup for every team, in the format written by ``generate_best_lineup``.
+
+    total_event_indices : dict
+        key : swimmer name
+        value : array of indices of the relays the swimmer swims across all teams
+
+    searches_finished : dict
+        key : team name
+        value : ``False`` if the team's search stopped at ``node_limit``, so its lineup is
+        the best one found rather than the best one possible
+    '''
     global temp
-    all_rankings = extract_all_rankings(school_name, gender)
+    search = SEARCH_ENGINES[engine]
+    if swimmer_relay_caps is None:
+        swimmer_relay_caps = {}
 
     complete_lineup = {
         "Maximum Relays Per Event": teams_per_event,
         "Maximum Relays Per Swimmer": relays_per_swimmer,
     }
 
-    modified_rankings = all_rankings.copy()
-    swimmer_event_limits = {}
+    swimmer_limits = {}
+    for swimmer, cap in swimmer_relay_caps.items():
+        swimmer_limits[swimmer] = max(min(cap, relays_per_swimmer), 0)
+
+    capped_out_swimmers = [swimmer for swimmer, limit in swimmer_limits.items() if limit == 0]
+    modified_rankings = remove_swimmers_from_all_rankings(all_rankings, capped_out_swimmers)
+    swimmer_event_limits = {swimmer: limit for swimmer, limit in swimmer_limits.items() 
+                            if 0 < limit < relays_per_swimmer}
 
     total_event_indices = defaultdict(list)
     previous_assigned_events = {}
+    searches_finished = {}
 
     for i in range(teams_per_event):
         temp = i
@@ -739,15 +1165,25 @@ def generate_best_lineup(teams_per_event, relays_per_swimmer, school_name, gende
         team_name = TEAM_NAMES[i]
         print(f"Finding best lineup for {team_name}...")
 
-        minimum_events = swimmer_minimum_events(modified_rankings, relays_per_swimmer, previous_assigned_events)
+        minimum_events = swimmer_minimum_events(modified_rankings, relays_per_swimmer, 
+                                                previous_assigned_events, swimmer_event_limits,
+                                                relay_events, swimmer_genders)
 
         relay_teams = {}
-        for event in RELAY_EVENTS:
+        for event in relay_events:
             relay_teams[event] = [None] * 4
 
-        lineups = generate_all_lineups(defaultdict(list), relay_teams, modified_rankings, 
-                                          relays_per_swimmer, minimum_events, 
-                                          swimmer_event_limits, [], previous_assigned_events)
+        team_checkpoint_file = None if checkpoint_file is None else f"{checkpoint_file}.{i}"
+        lineups, finished = search(relay_teams, modified_rankings, relays_per_swimmer, minimum_events, 
+                                   swimmer_event_limits, previous_assigned_events, swimmer_genders,
+                                   node_limit=node_limit, checkpoint_file=team_checkpoint_file)
+
+        if not finished and team_checkpoint_file is not None:
+            print(f"Paused search for {team_name}, saved to {team_checkpoint_file}.")
+            break
+        if not finished:
+            print(f"Stopped search for {team_name} after {node_limit} combinations.")
+        searches_finished[team_name] = finished
         
         lineup, points = get_fastest_lineup(lineups, gender)
 
@@ -762,50 +1198,160 @@ def generate_best_lineup(teams_per_event, relays_per_swimmer, school_name, gende
             "Lineup": relay_teams,
         }
 
-        # reset rankings based on previous relay teams
+        for swimmer, event_lineup in swimmer_events.items():
+            total_event_indices[swimmer] = total_event_indices[swimmer] + event_lineup
+
+        # reset rankings based on all previous relay teams
         maxed_swimmers = []
         swimmer_event_limits.clear()
         previous_assigned_events.clear()
 
-        for swimmer, event_lineup in swimmer_events.items():
-            prev_events = total_event_indices[swimmer]
-
-            if len(prev_events) + len(event_lineup) == relays_per_swimmer:
+        for swimmer in list(total_event_indices.keys()) + list(swimmer_limits.keys()):
+            if swimmer in swimmer_event_limits or swimmer in maxed_swimmers:
+                continue
+            event_lineup = total_event_indices[swimmer]
+            limit = swimmer_limits[swimmer] if swimmer in swimmer_limits.keys() else relays_per_swimmer
+            if len(event_lineup) >= limit:
                 # maxed out relays
                 maxed_swimmers.append(swimmer)
-            else:
-                swimmer_event_limits[swimmer] = relays_per_swimmer - (len(event_lineup) + len(prev_events))
+                continue
+            if len(event_lineup) > 0 or limit < relays_per_swimmer:
+                swimmer_event_limits[swimmer] = limit - len(event_lineup)
+            if len(event_lineup) > 0:
                 previous_assigned_events[swimmer] = event_lineup
-            total_event_indices[swimmer] = prev_events + event_lineup
 
         modified_rankings = remove_swimmers_from_all_rankings(modified_rankings, maxed_swimmers)
 
         print(f"Finished in {round(perf_counter() - t0,2)} seconds.")
 
+    return complete_lineup, total_event_indices, searches_finished
+
+def merge_rankings(male_rankings: dict[str, list[SwimmerTime]],
+                   female_rankings: dict[str, list[SwimmerTime]]
+                   ) -> tuple[dict[str, list[SwimmerTime]], dict[str, str]]:
+    '''
+    Combines the men's and women's rankings for mixed relays.
+
+    Returns
+    -------
+    all_rankings : dict
+        key : event name
+        value : array of tuples with rankings of both genders, ordered by time
+
+    swimmer_genders : dict
+        key : swimmer name
+        value : "male" or "female"
+    '''
+    swimmer_genders = {}
+    for gender, gender_rankings in (("male", male_rankings), ("female", female_rankings)):
+        for rankings in gender_rankings.values():
+            for swimmer_time in rankings:
+                name = swimmer_time.name
+                if swimmer_genders.get(name, gender) != gender:
+                    raise ValueError(f"{name} is in both the men's and women's rankings.")
+                swimmer_genders[name] = gender
+
+    all_rankings = {}
+    for event in INDIVIDUAL_EVENTS:
+        rankings = male_rankings.get(event, []) + female_rankings.get(event, [])
+        # sorting is stable, so ties keep each gender's ranking order
+        all_rankings[event] = sorted(rankings, key=lambda swimmer_time: swimmer_time.time)
+    return all_rankings, swimmer_genders
+
+def solve_mixed_lineup(male_rankings: dict[str, list[SwimmerTime]],
+                       female_rankings: dict[str, list[SwimmerTime]],
+                       teams_per_event: int,
+                       relays_per_swimmer: int,
+                       swimmer_relay_caps: dict[str, int] = None,
+                       engine: str = "dfs"
+                       ) -> tuple[dict, dict[str, list[int]], dict[str, bool]]:
+    '''
+    Finds the best lineup for the mixed relays. See ``solve_lineup`` for details.
+    '''
+    all_rankings, swimmer_genders = merge_rankings(male_rankings, female_rankings)
+    return solve_lineup(all_rankings, teams_per_event, relays_per_swimmer, "mixed", 
+                        swimmer_relay_caps, engine, MIXED_RELAY_EVENTS, swimmer_genders)
+
+def solve_meet_lineups(male_rankings: dict[str, list[SwimmerTime]],
+                       female_rankings: dict[str, list[SwimmerTime]],
+                       teams_per_event: int,
+                       relays_per_swimmer: int,
+                       engine: str = "dfs"
+                       ) -> dict[str, dict]:
+    '''
+    Finds the best lineup for a meet with men's, women's and mixed relays, where
+    ``relays_per_swimmer`` covers all three.
+
+    Rather than searching every relay at once over both rosters, the men's and women's relays
+    are solved first, since they don't share swimmers, and the mixed relays are then solved
+    with the relays each swimmer has left. Each search is no larger than a single-gender run.
+
+    Returns
+    -------
+    lineups : dict
+        key : "male", "female" or "mixed"
+        value : the lineup for those relays, see ``solve_lineup``
+    '''
+    lineups = {}
+    swimmer_relay_caps = {}
+    for gender, rankings in (("male", male_rankings), ("female", female_rankings)):
+        complete_lineup, total_event_indices, _ = solve_lineup(
+            rankings, teams_per_event, relays_per_swimmer, gender, engine=engine)
+        lineups[gender] = complete_lineup
+        for swimmer, events in total_event_indices.items():
+            if len(events) > 0:
+                swimmer_relay_caps[swimmer] = relays_per_swimmer - len(events)
+
+    lineups["mixed"], _, _ = solve_mixed_lineup(male_rankings, female_rankings, teams_per_event, 
+                                             relays_per_swimmer, swimmer_relay_caps, engine)
+    return lineups
+
+def generate_best_lineup(teams_per_event, relays_per_swimmer, school_name, gender, all_rankings=None):
+    '''
+    Finds the best lineup for each team and writes it to a json file. Rankings are parsed
+    from the pdfs in ``times/`` unless ``all_rankings`` is given, e.g. from ``results_store.best_times``.
+    '''
+    if all_rankings is None:
+        all_rankings = extract_all_rankings(school_name, gender)
+
+    complete_lineup, _, _ = solve_lineup(all_rankings, teams_per_event, relays_per_swimmer, gender)
+
     with open(f'lineup_{teams_per_event}_rpe_{relays_per_swimmer}_rps_{gender}.json','w') as f:
         json.dump(complete_lineup,f,indent = 2)
 
     print(f"Finished.")
     
-def check_swimmer_limit(relays_per_event, relays_per_swimmer, gender):
-    data = {}
-    with open(f'lineup_{relays_per_event}_rpe_{relays_per_swimmer}_rps_{gender}.json','r') as f:
-        data = json.load(f)
-    swimmer_count = defaultdict(int)
-    for team in TEAM_NAMES.values():
-        if team not in data.keys():
-            continue
-        lineup_data = data[team]
-        lineup = lineup_data["Lineup"]
-        for relay_team in lineup.values():
-            for pair in relay_team:
-                name = pair[1]
-                swimmer_count[name] += 1
-                if swimmer_count[name] <= relays_per_swimmer:
-                    continue
-                print(f"{name} set to swim more than {relays_per_swimmer} events.")
-                return
-    print(f"All swimmers within {relays_per_swimmer} events.")
+def generate_best_mixed_lineup(teams_per_event, relays_per_swimmer, school_name, 
+                               male_rankings=None, female_rankings=None):
+    '''
+    Finds the best lineup for the mixed relays and writes it to a json file. See ``generate_best_lineup``.
+    '''
+    if male_rankings is None:
+        male_rankings = extract_all_rankings(school_name, "male")
+    if female_rankings is None:
+        female_rankings = extract_all_rankings(school_name, "female")
+
+    complete_lineup, _, _ = solve_mixed_lineup(male_rankings, female_rankings, teams_per_event, relays_per_swimmer)
+
+    with open(f'lineup_{teams_per_event}_rpe_{relays_per_swimmer}_rps_mixed.json','w') as f:
+        json.dump(complete_lineup,f,indent = 2)
+
+    print(f"Finished.")
+
+def check_lineup(relays_per_event, relays_per_swimmer, school_name, gender):
+    from verifier import verify_lineup_file
+    swimmer_genders = None
+    if gender == "mixed":
+        all_rankings, swimmer_genders = merge_rankings(extract_all_rankings(school_name, "male"),
+                                                       extract_all_rankings(school_name, "female"))
+    else:
+        all_rankings = extract_all_rankings(school_name, gender)
+    violations = verify_lineup_file(
+        f'lineup_{relays_per_event}_rpe_{relays_per_swimmer}_rps_{gender}.json', all_rankings, swimmer_genders)
+    for violation in violations:
+        print(violation)
+    if len(violations) == 0:
+        print(f"Lineup is valid.")
 
 def main():
     school_name = "California Institute of Technology"
@@ -813,7 +1359,7 @@ def main():
     teams_per_event = 3
     relays_per_swimmer = 3
     generate_best_lineup(teams_per_event, relays_per_swimmer, school_name, gender)
-    check_swimmer_limit(teams_per_event, relays_per_swimmer, gender)
+    check_lineup(teams_per_event, relays_per_swimmer, school_name, gender)
 
 if __name__=="__main__":
     main()
\ No newline at end of file
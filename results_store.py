@@ -0,0 +1,123 @@
+import sqlite3
+from datetime import date as Date
+
+from main import INDIVIDUAL_EVENTS, SwimmerTime, extract_all_rankings
+
+DEFAULT_DATABASE = "results.db"
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS swims (
+    swimmer TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    event TEXT NOT NULL,
+    time REAL NOT NULL,
+    date TEXT NOT NULL,
+    meet TEXT NOT NULL,
+    PRIMARY KEY (swimmer, gender, event, date, meet)
+);
+CREATE INDEX IF NOT EXISTS swims_event_time ON swims (event, time);
+CREATE INDEX IF NOT EXISTS swims_swimmer ON swims (swimmer);
+'''
+
+def open_store(file_name: str = DEFAULT_DATABASE) -> sqlite3.Connection:
+    '''
+    Opens (and creates, if needed) the results database at ``file_name``.
+    '''
+    conn = sqlite3.connect(file_name)
+    conn.executescript(SCHEMA)
+    return conn
+
+def add_swims(conn: sqlite3.Connection,
+              swims: list[tuple[str, str, str, float, str, str]]):
+    '''
+    Inserts swims in a single transaction. A swim with the same swimmer, gender, event, date
+    and meet as an existing swim replaces it.
+
+    Parameters
+    ----------
+    swims : arr of tuples
+        Each tuple has the format (swimmer, gender, event, time, date, meet), where ``time``
+        is in seconds and ``date`` is an ISO date string ("YYYY-MM-DD").
+    '''
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO swims (swimmer, gender, event, time, date, meet) "
+            "VALUES (?, ?, ?, ?, ?, ?)", swims)
+
+def import_rankings(conn: sqlite3.Connection,
+                    all_rankings: dict[str, list[SwimmerTime]],
+                    gender: str, date: str, meet: str):
+    '''
+    Stores rankings, e.g. from ``extract_all_rankings``, as swims at ``meet`` on ``date``.
+    '''
+    swims = []
+    for event, rankings in all_rankings.items():
+        for swimmer_time in rankings:
+            swims.append((swimmer_time.name, gender, event, swimmer_time.time, date, meet))
+    add_swims(conn, swims)
+
+def import_pdfs(conn: sqlite3.Connection, school_name: str, gender: str,
+                date: str = None, meet: str = "Top Times"):
+    '''
+    Parses the top times pdfs for ``school_name`` and stores them. ``date`` defaults to today.
+    '''
+    if date is None:
+        date = Date.today().isoformat()
+    all_rankings = extract_all_rankings(school_name, gender, write=False)
+    import_rankings(conn, all_rankings, gender, date, meet)
+
+def best_times(conn: sqlite3.Connection, gender: str, since: str = None,
+               events: list[str] = INDIVIDUAL_EVENTS) -> dict[str, list[SwimmerTime]]:
+    '''
+    Returns each swimmer's best time in each event, in the format returned by
+    ``extract_all_rankings``.
+
+    Parameters
+    ----------
+    gender : str
+        Only swims by this gender are considered.
+
+    since : str, optional
+        An ISO date string. Only swims on or after this date are considered.
+
+    events : arr of str
+        The events to return rankings for.
+
+    Returns
+    -------
+    all_rankings : dict
+        key : event name
+        value : array of ``SwimmerTime`` ordered by time, from fastest to slowest
+    '''
+    if since is None:
+        since = ""
+    all_rankings = {}
+    for event in events:
+        all_rankings[event] = []
+    placeholders = ", ".join("?" * len(events))
+    rows = conn.execute(
+        "SELECT event, swimmer, MIN(time) AS best FROM swims "
+        f"WHERE event IN ({placeholders}) AND gender = ? AND date >= ? "
+        "GROUP BY event, swimmer ORDER BY event, best, MIN(rowid)",
+        (*events, gender, since))
+    for event, swimmer, time in rows:
+        all_rankings[event].append(SwimmerTime(swimmer, time))
+    return all_rankings
+
+def swimmer_history(conn: sqlite3.Connection, swimmer: str) -> list[tuple[str, float, str, str]]:
+    '''
+    Returns every swim by ``swimmer`` as (event, time, date, meet) tuples, ordered by date.
+    '''
+    return conn.execute(
+        "SELECT event, time, date, meet FROM swims WHERE swimmer = ? ORDER BY date, event",
+        (swimmer,)).fetchall()
+
+def main():
+    school_name = "California Institute of Technology"
+    conn = open_store()
+    for gender in ["male", "female"]:
+        import_pdfs(conn, school_name, gender)
+    conn.close()
+
+if __name__=="__main__":
+    main()
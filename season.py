@@ -0,0 +1,204 @@
+import json, sys
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from main import RELAY_EVENTS, SwimmerTime, extract_all_rankings, solve_lineup
+
+# ``unavailable_swimmers`` cannot swim at the meet. Relays at meets with ``counts_toward_cap``
+# set count toward the season cap, so those meets are solved in order; the rest are independent.
+Meet = namedtuple("Meet", ["name", "unavailable_swimmers", "counts_toward_cap"], defaults=[(), True])
+
+def load_schedule(file_name: str) -> list[Meet]:
+    '''
+    Reads a meet schedule from a json file. The file contains an array of meets in the order
+    they are swum, e.g.
+
+        [{"name": "SCIAC Dual", "unavailable": ["Max Oberg"], "counts_toward_cap": false},
+         {"name": "SCIAC Championships"}]
+    '''
+    with open(file_name, 'r') as f:
+        data = json.load(f)
+    schedule = []
+    for meet in data:
+        schedule.append(Meet(meet["name"], tuple(meet.get("unavailable", [])),
+                             meet.get("counts_toward_cap", True)))
+    check_meet_names(schedule)
+    return schedule
+
+def check_meet_names(schedule: list[Meet]):
+    '''
+    Raises a ``ValueError`` if two meets in ``schedule`` have the same name.
+    '''
+    names = set()
+    for meet in schedule:
+        if meet.name in names:
+            raise ValueError(f"The schedule has more than one meet named {meet.name}.")
+        names.add(meet.name)
+
+def solve_meet(meet: Meet,
+               all_rankings: dict[str, list[SwimmerTime]],
+               teams_per_event: int,
+               relays_per_swimmer: int,
+               gender: str,
+               swimmer_relay_caps: dict[str, int] = None,
+               engine: str = "dfs",
+               node_limit: int = None
+               ) -> tuple[str, dict, dict[str, list[int]], dict[str, bool]]:
+    '''
+    Finds the best lineup for a single meet. See ``solve_lineup`` for details.
+    '''
+    caps = {} if swimmer_relay_caps is None else swimmer_relay_caps.copy()
+    for swimmer in meet.unavailable_swimmers:
+        caps[swimmer] = 0
+    complete_lineup, total_event_indices, searches_finished = solve_lineup(
+        all_rankings, teams_per_event, relays_per_swimmer, gender, caps,
+        engine=engine, node_limit=node_limit)
+    return meet.name, complete_lineup, total_event_indices, searches_finished
+
+def solve_capped_meets(meets: list[Meet],
+                       all_rankings: dict[str, list[SwimmerTime]],
+                       teams_per_event: int,
+                       relays_per_swimmer: int,
+                       gender: str,
+                       season_relays_per_swimmer: int,
+                       engine: str = "dfs",
+                       node_limit: int = None
+                       ) -> list[tuple[str, dict, dict[str, list[int]], dict[str, bool]]]:
+    '''
+    Solves meets that share the season cap in order, carrying the relays each swimmer has
+    already swum into the next meet as a lower per-swimmer limit.
+    '''
+    swimmers = set()
+    for rankings in all_rankings.values():
+        for swimmer_time in rankings:
+            swimmers.add(swimmer_time.name)
+
+    season_relays = defaultdict(int)
+    results = []
+    for meet in meets:
+        caps = {}
+        for swimmer in swimmers:
+            remaining = season_relays_per_swimmer - season_relays[swimmer]
+            if remaining < relays_per_swimmer:
+                caps[swimmer] = remaining
+        result = solve_meet(meet, all_rankings, teams_per_event, relays_per_swimmer, gender, caps,
+                            engine, node_limit)
+        for swimmer, events in result[2].items():
+            season_relays[swimmer] += len(events)
+        results.append(result)
+    return results
+
+def plan_season(schedule: list[Meet],
+                all_rankings: dict[str, list[SwimmerTime]],
+                teams_per_event: int,
+                relays_per_swimmer: int,
+                gender: str,
+                season_relays_per_swimmer: int = None,
+                max_workers: int = None,
+                engine: str = "dfs",
+                node_limit: int = None) -> dict:
+    '''
+    Finds the best lineup for every meet in a season.
+
+    Meets that count toward the season cap depend on each other, so they are solved in order
+    as a single job. Every other meet is independent and solved as its own job. Jobs run
+    concurrently in a process pool.
+
+    Parameters
+    ----------
+    schedule : arr of Meet
+        The meets in the order they are swum.
+
+    all_rankings : dict
+        key : event name
+        value : array of tuples with rankings
+        A dictionary of rankings for each event. See extract_rankings for more details.
+
+    season_relays_per_swimmer : int, optional
+        The maximum number of relays each swimmer can swim across all capped meets.
+        If ``None``, every meet is independent.
+
+    max_workers : int, optional
+        The number of worker processes. Defaults to the number of processors.
+
+    engine : str
+        The name of the search engine in ``SEARCH_ENGINES`` used for each meet.
+
+    node_limit : int, optional
+        The maximum number of combinations each team's search tries. By default every search
+        runs to the end, which can take very long when swimmers have little of their season cap left.
+
+    Returns
+    -------
+    report : dict
+        The lineup for each meet along with the number of relays each swimmer swims at each meet.
+        "Searches Finished" records, for each meet and team, whether the team's search ran to
+        the end or stopped at ``node_limit``.
+    '''
+    check_meet_names(schedule)
+    if season_relays_per_swimmer is None:
+        capped_meets = []
+    else:
+        capped_meets = [meet for meet in schedule if meet.counts_toward_cap]
+    independent_meets = [meet for meet in schedule if meet not in capped_meets]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        if len(capped_meets) > 0:
+            futures.append(executor.submit(
+                solve_capped_meets, capped_meets, all_rankings, teams_per_event,
+                relays_per_swimmer, gender, season_relays_per_swimmer, engine, node_limit))
+        for meet in independent_meets:
+            futures.append(executor.submit(
+                solve_meet, meet, all_rankings, teams_per_event, relays_per_swimmer, gender,
+                None, engine, node_limit))
+        for i, future in enumerate(futures):
+            if i == 0 and len(capped_meets) > 0:
+                meet_results = future.result()
+            else:
+                meet_results = [future.result()]
+            for meet_name, complete_lineup, total_event_indices, searches_finished in meet_results:
+                results[meet_name] = (complete_lineup, total_event_indices, searches_finished)
+
+    report = {
+        "Maximum Relays Per Event": teams_per_event,
+        "Maximum Relays Per Swimmer": relays_per_swimmer,
+        "Maximum Relays Per Swimmer Per Season": season_relays_per_swimmer,
+        "Meets": {},
+        "Searches Finished": {},
+        "Season Relays": {},
+    }
+    season_relays = defaultdict(dict)
+    for meet in schedule:
+        complete_lineup, total_event_indices, searches_finished = results[meet.name]
+        report["Meets"][meet.name] = complete_lineup
+        report["Searches Finished"][meet.name] = searches_finished
+        for swimmer, events in total_event_indices.items():
+            if len(events) == 0:
+                continue
+            season_relays[swimmer][meet.name] = [RELAY_EVENTS[i] for i in events]
+    for swimmer in sorted(season_relays.keys()):
+        relays = season_relays[swimmer]
+        report["Season Relays"][swimmer] = {
+            "Total": sum(len(events) for events in relays.values()),
+            "Meets": relays,
+        }
+    return report
+
+def main():
+    school_name = "California Institute of Technology"
+    gender = "male"
+    teams_per_event = 3
+    relays_per_swimmer = 3
+    season_relays_per_swimmer = 6
+    schedule = load_schedule(sys.argv[1])
+    all_rankings = extract_all_rankings(school_name, gender)
+    report = plan_season(schedule, all_rankings, teams_per_event, relays_per_swimmer,
+                         gender, season_relays_per_swimmer)
+    with open(f'season_{teams_per_event}_rpe_{relays_per_swimmer}_rps_{gender}.json','w') as f:
+        json.dump(report,f,indent = 2)
+    print(f"Finished.")
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,144 @@
+import mmap, struct, sys
+from array import array
+
+from main import INDIVIDUAL_EVENTS, SwimmerTime, extract_all_rankings
+
+# File layout, all little-endian and 4-byte aligned:
+#   header          MAGIC, version, event count, name count, name table size
+#   event table     for each event: event name (8 bytes, null padded), entry count, entry offset
+#   name offsets    uint32 offset of each name in the name table, plus the end of the table
+#   name table      utf-8 names back to back, padded to a multiple of 4 bytes
+#   entries         for each event: uint32 name indices, then float32 times, both in ranking order
+MAGIC = b"SWIMSNAP"
+VERSION = 1
+HEADER = struct.Struct("<8sHHII")
+EVENT_ENTRY = struct.Struct("<8sII")
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % 4)
+
+def write_snapshot(all_rankings: dict[str, list[SwimmerTime]], file_name: str,
+                   events: list[str] = INDIVIDUAL_EVENTS):
+    '''
+    Writes rankings to a binary snapshot that ``load_snapshot`` can read without parsing.
+    Each swimmer's name is stored once, and each event stores its rankings as fixed-width
+    name indices and float32 times.
+
+    Parameters
+    ----------
+    all_rankings : dict
+        key : event name
+        value : array of tuples with rankings
+        A dictionary of rankings for each event. See extract_rankings for more details.
+
+    file_name : str
+        The file to write the snapshot to.
+
+    events : arr of str
+        The events to write. Events missing from ``all_rankings`` are written with no entries.
+    '''
+    name_indices = {}
+    names = []
+    for event in events:
+        for swimmer_time in all_rankings.get(event, []):
+            if swimmer_time.name not in name_indices:
+                name_indices[swimmer_time.name] = len(names)
+                names.append(swimmer_time.name)
+
+    name_offsets = array("I", [0])
+    name_table = bytearray()
+    for name in names:
+        name_table += name.encode("utf-8")
+        name_offsets.append(len(name_table))
+    name_table += _padding(len(name_table))
+
+    entries_offset = (HEADER.size + EVENT_ENTRY.size * len(events)
+                      + name_offsets.itemsize * len(name_offsets) + len(name_table))
+    event_table = bytearray()
+    entries = bytearray()
+    for event in events:
+        rankings = all_rankings.get(event, [])
+        indices = array("I", [name_indices[swimmer_time.name] for swimmer_time in rankings])
+        times = array("f", [swimmer_time.time for swimmer_time in rankings])
+        event_table += EVENT_ENTRY.pack(event.encode("ascii"), len(rankings), entries_offset + len(entries))
+        entries += _little_endian(indices)
+        entries += _little_endian(times)
+
+    with open(file_name, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(events), len(names), len(name_table)))
+        f.write(event_table)
+        f.write(_little_endian(name_offsets))
+        f.write(name_table)
+        f.write(entries)
+
+def _uint32_view(buffer, offset: int, count: int):
+    view = buffer[offset:offset + 4 * count]
+    if sys.byteorder != "little":
+        values = array("I")
+        values.frombytes(view)
+        values.byteswap()
+        return values
+    return view.cast("I")
+
+def _float32_view(buffer, offset: int, count: int):
+    view = buffer[offset:offset + 4 * count]
+    if sys.byteorder != "little":
+        values = array("f")
+        values.frombytes(view)
+        values.byteswap()
+        return values
+    return view.cast("f")
+
+def load_snapshot(file_name: str) -> dict[str, list[SwimmerTime]]:
+    '''
+    Loads rankings written by ``write_snapshot``, in the format returned by ``extract_all_rankings``.
+    The file is memory-mapped and its arrays are read in place.
+    '''
+    with open(file_name, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buffer = memoryview(mapped)
+            try:
+                return _read_snapshot(buffer)
+            finally:
+                buffer.release()
+
+def _read_snapshot(buffer) -> dict[str, list[SwimmerTime]]:
+    magic, version, event_count, name_count, name_table_size = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} roster snapshot.")
+
+    offset = HEADER.size + EVENT_ENTRY.size * event_count
+    name_offsets = _uint32_view(buffer, offset, name_count + 1)
+    offset += 4 * (name_count + 1)
+    name_table = bytes(buffer[offset:offset + name_table_size])
+    names = [sys.intern(name_table[name_offsets[i]:name_offsets[i + 1]].decode("utf-8"))
+             for i in range(name_count)]
+    if isinstance(name_offsets, memoryview):
+        name_offsets.release()
+
+    all_rankings = {}
+    for i in range(event_count):
+        event, count, entry_offset = EVENT_ENTRY.unpack_from(buffer, HEADER.size + EVENT_ENTRY.size * i)
+        indices = _uint32_view(buffer, entry_offset, count)
+        times = _float32_view(buffer, entry_offset + 4 * count, count)
+        # float32 keeps times to well within a hundredth, the precision they are recorded to
+        all_rankings[event.rstrip(b"\0").decode("ascii")] = [
+            SwimmerTime(names[index], round(time, 2)) for index, time in zip(indices, times)]
+        if isinstance(indices, memoryview):
+            indices.release()
+            times.release()
+    return all_rankings
+
+def main():
+    school_name = "California Institute of Technology"
+    for gender in ["male", "female"]:
+        write_snapshot(extract_all_rankings(school_name, gender), f"roster_{gender}.snap")
+
+if __name__=="__main__":
+    main()
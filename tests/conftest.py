@@ -0,0 +1,11 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def pytest_addoption(parser):
+    parser.addoption("--update-golden", action="store_true",
+                     help="rewrite the generated golden files instead of comparing against them")
+    parser.addoption("--update-baseline", action="store_true",
+                     help="record the current runtime and peak memory as the performance baseline")
+    parser.addoption("--check-runtime", action="store_true",
+                     help="also fail if a search is much slower than the recorded baseline")
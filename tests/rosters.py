@@ -0,0 +1,82 @@
+import os, random
+
+from main import INDIVIDUAL_EVENTS, SwimmerTime, extract_all_rankings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHOOL_NAME = "California Institute of Technology"
+
+# roughly a D3 conference-level time in each event, in seconds
+BASE_TIMES = {
+    "50fr": 21,
+    "100fr": 46,
+    "200fr": 100,
+    "50ba": 24,
+    "100ba": 52,
+    "50br": 26,
+    "100br": 57,
+    "50fl": 23,
+    "100fl": 50,
+}
+
+# name : (swimmers, seed)
+SYNTHETIC_ROSTERS = {
+    "synthetic_24": (24, 2),
+    "synthetic_32": (32, 1),
+    "synthetic_40": (40, 2),
+}
+
+# name : (men's roster, women's roster), each a bundled gender or synthetic roster
+MIXED_ROSTERS = {
+    "mixed": ("male", "female"),
+    "synthetic_mixed": ("synthetic_32", "synthetic_24"),
+}
+
+def bundled_rankings(gender: str) -> dict[str, list[SwimmerTime]]:
+    '''
+    Parses the pdfs in ``times/`` for ``gender``.
+    '''
+    return extract_all_rankings(SCHOOL_NAME, gender, write=False, directory=os.path.join(ROOT, "times"))
+
+def synthetic_rankings(swimmers: int, seed: int, prefix: str = "Swimmer") -> dict[str, list[SwimmerTime]]:
+    '''
+    Returns rankings for a random roster. Each swimmer specializes in one stroke, is up to 5%
+    slower off-stroke and has no time in about 30% of events.
+    '''
+    rng = random.Random(seed)
+    all_rankings = {event: [] for event in INDIVIDUAL_EVENTS}
+    for i in range(swimmers):
+        stroke = rng.choice(["fr", "ba", "br", "fl"])
+        ability = rng.uniform(0, 0.15)
+        for event in INDIVIDUAL_EVENTS:
+            if rng.random() < 0.3:
+                continue
+            penalty = 0 if event.endswith(stroke) else rng.uniform(0, 0.05)
+            time = round(BASE_TIMES[event] * (1 + ability + penalty + rng.uniform(0, 0.03)), 2)
+            all_rankings[event].append(SwimmerTime(f"{prefix} {i:02d}", time))
+    for event in INDIVIDUAL_EVENTS:
+        all_rankings[event].sort(key=lambda swimmer_time: swimmer_time.time)
+    return all_rankings
+
+def roster_rankings(roster: str, prefix: str = "Swimmer") -> dict[str, list[SwimmerTime]]:
+    '''
+    Returns the rankings for a bundled gender ("male", "female") or a synthetic roster.
+    '''
+    if roster in SYNTHETIC_ROSTERS.keys():
+        return synthetic_rankings(*SYNTHETIC_ROSTERS[roster], prefix)
+    return bundled_rankings(roster)
+
+def mixed_roster_rankings(roster: str) -> tuple[dict[str, list[SwimmerTime]], dict[str, list[SwimmerTime]]]:
+    '''
+    Returns the men's and women's rankings for a mixed roster.
+    '''
+    male_roster, female_roster = MIXED_ROSTERS[roster]
+    return roster_rankings(male_roster, "Man"), roster_rankings(female_roster, "Woman")
+
+def golden_lineup_file(roster: str) -> str:
+    '''
+    Returns the golden lineup file for ``roster``. The bundled rosters use the lineups committed
+    at the top of the repo.
+    '''
+    if roster in SYNTHETIC_ROSTERS.keys() or roster in MIXED_ROSTERS.keys():
+        return os.path.join(ROOT, "tests", "golden", f"lineup_3_rpe_3_rps_{roster}.json")
+    return os.path.join(ROOT, f"lineup_3_rpe_3_rps_{roster}.json")
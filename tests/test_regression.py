@@ -0,0 +1,160 @@
+import json, os, tracemalloc
+from time import perf_counter
+
+import pytest
+
+import main
+from main import SEARCH_ENGINES, TEAM_NAMES, merge_rankings, solve_lineup, solve_meet_lineups, solve_mixed_lineup
+from rosters import ROOT, MIXED_ROSTERS, SYNTHETIC_ROSTERS, golden_lineup_file, mixed_roster_rankings, roster_rankings
+from verifier import verify_lineup
+
+BASELINE_FILE = os.path.join(ROOT, "tests", "performance_baseline.json")
+
+# a run fails if it tries more combinations than the baseline, or uses more than ``MEMORY_TOLERANCE``
+# times the baseline peak plus ``MEMORY_SLACK`` bytes. Runtimes depend on the machine, so they are
+# only checked with --check-runtime, against ``RUNTIME_TOLERANCE`` times the baseline plus
+# ``RUNTIME_SLACK`` seconds.
+RUNTIME_TOLERANCE = 1.5
+RUNTIME_SLACK = 0.05
+MEMORY_TOLERANCE = 1.2
+MEMORY_SLACK = 256 * 1024
+RUNTIME_REPEATS = 3
+
+GENDERS = ["male", "female"]
+ROSTERS = GENDERS + list(SYNTHETIC_ROSTERS.keys()) + list(MIXED_ROSTERS.keys())
+GENERATED_ROSTERS = list(SYNTHETIC_ROSTERS.keys()) + list(MIXED_ROSTERS.keys())
+
+_rankings_cache = {}
+
+def rankings_for(roster):
+    if roster in GENDERS or roster == "mixed":
+        pytest.importorskip("PyPDF2")
+    if roster not in _rankings_cache:
+        if roster in MIXED_ROSTERS.keys():
+            _rankings_cache[roster] = mixed_roster_rankings(roster)
+        else:
+            _rankings_cache[roster] = roster_rankings(roster)
+    return _rankings_cache[roster]
+
+def gender_for(roster):
+    return roster if roster in GENDERS else "male"
+
+def as_json(data):
+    return json.loads(json.dumps(data))
+
+def solve(engine, roster):
+    if roster in MIXED_ROSTERS.keys():
+        male_rankings, female_rankings = rankings_for(roster)
+        complete_lineup, _, _ = solve_mixed_lineup(male_rankings, female_rankings, 3, 3, engine=engine)
+    else:
+        complete_lineup, _, _ = solve_lineup(rankings_for(roster), 3, 3, gender_for(roster), engine=engine)
+    return complete_lineup
+
+@pytest.mark.parametrize("gender", GENDERS)
+def test_parser_matches_golden(gender, request):
+    file_name = os.path.join(ROOT, "tests", "golden", f"rankings_{gender}.json")
+    rankings = as_json(rankings_for(gender))
+    if request.config.getoption("--update-golden"):
+        with open(file_name, 'w') as f:
+            json.dump(rankings, f, indent = 2)
+        return
+    with open(file_name, 'r') as f:
+        golden = json.load(f)
+    assert rankings == golden
+
+@pytest.mark.parametrize("roster", ROSTERS)
+@pytest.mark.parametrize("engine", SEARCH_ENGINES.keys())
+def test_engine_matches_golden(engine, roster, request):
+    complete_lineup = as_json(solve(engine, roster))
+    file_name = golden_lineup_file(roster)
+    if request.config.getoption("--update-golden") and roster in GENERATED_ROSTERS:
+        with open(file_name, 'w') as f:
+            json.dump(complete_lineup, f, indent = 2)
+        return
+    with open(file_name, 'r') as f:
+        golden = json.load(f)
+
+    for team_name in TEAM_NAMES.values():
+        assert (team_name in complete_lineup) == (team_name in golden), team_name
+        if team_name not in golden:
+            continue
+        assert (complete_lineup[team_name]["Average Points Per Relay"] 
+                == golden[team_name]["Average Points Per Relay"]), team_name
+        assert complete_lineup[team_name]["Lineup"] == golden[team_name]["Lineup"], team_name
+    assert complete_lineup == golden
+
+@pytest.mark.parametrize("roster", MIXED_ROSTERS.keys())
+@pytest.mark.parametrize("engine", SEARCH_ENGINES.keys())
+def test_meet_lineups_are_valid(engine, roster):
+    male_rankings, female_rankings = rankings_for(roster)
+    lineups = solve_meet_lineups(male_rankings, female_rankings, 3, 3, engine)
+    all_rankings, swimmer_genders = merge_rankings(male_rankings, female_rankings)
+
+    # relay caps are shared by each gender's relays and the mixed relays
+    teams = {}
+    for relays, complete_lineup in lineups.items():
+        for team_name in TEAM_NAMES.values():
+            if team_name in complete_lineup:
+                teams[f"{relays} {team_name}"] = complete_lineup[team_name]["Lineup"]
+    assert "mixed A Team" in teams
+    assert verify_lineup(teams, 3, all_rankings, swimmer_genders=swimmer_genders) == []
+
+def count_combinations(engine, roster, monkeypatch):
+    combinations = 0
+    evaluate_combination = main.evaluate_combination
+    def counted_evaluate_combination(*args):
+        nonlocal combinations
+        combinations += 1
+        return evaluate_combination(*args)
+    with monkeypatch.context() as patch:
+        patch.setattr(main, "evaluate_combination", counted_evaluate_combination)
+        solve(engine, roster)
+    return combinations
+
+@pytest.mark.parametrize("roster", ROSTERS)
+@pytest.mark.parametrize("engine", SEARCH_ENGINES.keys())
+def test_engine_performance(engine, roster, request, monkeypatch):
+    rankings_for(roster)
+    combinations = count_combinations(engine, roster, monkeypatch)
+
+    update_baseline = request.config.getoption("--update-baseline")
+    check_runtime = request.config.getoption("--check-runtime")
+    seconds = None
+    if update_baseline or check_runtime:
+        for _ in range(RUNTIME_REPEATS):
+            t0 = perf_counter()
+            solve(engine, roster)
+            elapsed = perf_counter() - t0
+            if seconds is None or elapsed < seconds:
+                seconds = elapsed
+
+    tracemalloc.start()
+    solve(engine, roster)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, 'r') as f:
+            baseline = json.load(f)
+
+    if update_baseline:
+        baseline.setdefault(engine, {})[roster] = {
+            "Combinations": combinations,
+            "Seconds": round(seconds, 4),
+            "Peak Bytes": peak_bytes,
+        }
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(baseline, f, indent = 2, sort_keys = True)
+        return
+
+    if engine not in baseline or roster not in baseline[engine]:
+        pytest.skip(f"no baseline for {engine} on {roster}, run with --update-baseline")
+    expected = baseline[engine][roster]
+    assert combinations <= expected["Combinations"], \
+        f"{engine} tried {combinations} combinations on {roster}, baseline is {expected['Combinations']}"
+    if check_runtime:
+        assert seconds <= expected["Seconds"] * RUNTIME_TOLERANCE + RUNTIME_SLACK, \
+            f"{engine} took {seconds:.4f}s on {roster}, baseline is {expected['Seconds']}s"
+    assert peak_bytes <= expected["Peak Bytes"] * MEMORY_TOLERANCE + MEMORY_SLACK, \
+        f"{engine} peaked at {peak_bytes} bytes on {roster}, baseline is {expected['Peak Bytes']} bytes"
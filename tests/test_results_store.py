@@ -0,0 +1,50 @@
+import pytest
+
+from main import SwimmerTime
+from results_store import best_times, import_rankings, open_store
+from rosters import SYNTHETIC_ROSTERS, synthetic_rankings
+
+@pytest.fixture
+def conn():
+    conn = open_store(":memory:")
+    yield conn
+    conn.close()
+
+@pytest.fixture
+def rankings():
+    return synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_24"])
+
+def swim_count(conn) -> int:
+    return conn.execute("SELECT COUNT(*) FROM swims").fetchone()[0]
+
+def slower(rankings: dict[str, list[SwimmerTime]], seconds: float) -> dict[str, list[SwimmerTime]]:
+    return {event: [SwimmerTime(name, round(time + seconds, 2)) for name, time in event_rankings]
+            for event, event_rankings in rankings.items()}
+
+def test_best_times_round_trip(conn, rankings):
+    import_rankings(conn, rankings, "male", "2024-01-20", "Dual")
+    assert best_times(conn, "male") == rankings
+
+def test_best_times_keeps_fastest_swim(conn, rankings):
+    import_rankings(conn, slower(rankings, 1), "male", "2024-01-20", "Dual")
+    import_rankings(conn, rankings, "male", "2024-02-20", "Championships")
+    assert best_times(conn, "male") == rankings
+
+def test_since_filters_by_date(conn, rankings):
+    import_rankings(conn, rankings, "male", "2023-02-20", "Championships")
+    import_rankings(conn, slower(rankings, 1), "male", "2024-01-20", "Dual")
+    assert best_times(conn, "male", since="2024-01-01") == slower(rankings, 1)
+    assert all(len(event_rankings) == 0 for event_rankings in best_times(conn, "male", since="2025-01-01").values())
+
+def test_reimport_replaces_swims(conn, rankings):
+    import_rankings(conn, slower(rankings, 1), "male", "2024-01-20", "Dual")
+    count = swim_count(conn)
+    import_rankings(conn, rankings, "male", "2024-01-20", "Dual")
+    assert swim_count(conn) == count
+    assert best_times(conn, "male") == rankings
+
+def test_genders_are_stored_separately(conn, rankings):
+    import_rankings(conn, rankings, "male", "2024-01-20", "Dual")
+    import_rankings(conn, slower(rankings, 1), "female", "2024-01-20", "Dual")
+    assert best_times(conn, "male") == rankings
+    assert best_times(conn, "female") == slower(rankings, 1)
@@ -0,0 +1,76 @@
+import pytest
+
+from main import (
+    SINGLE_GENDER_RELAY_EVENTS,
+    SEARCH_ORDERINGS,
+    generate_all_lineups,
+    solve_lineup,
+    swimmer_minimum_events,
+)
+from rosters import SYNTHETIC_ROSTERS, synthetic_rankings
+
+def search_inputs():
+    rankings = synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_24"])
+    relay_teams = {event: [None] * 4 for event in SINGLE_GENDER_RELAY_EVENTS}
+    top_events = swimmer_minimum_events(rankings, 3, {})
+    return relay_teams, rankings, 3, top_events, {}, {}
+
+@pytest.mark.parametrize("ordering", SEARCH_ORDERINGS)
+def test_node_limit_stops_search(ordering):
+    lineups, finished = generate_all_lineups(*search_inputs(), ordering=ordering, node_limit=10)
+    assert not finished
+    assert len(lineups) <= 10
+
+@pytest.mark.parametrize("ordering", SEARCH_ORDERINGS)
+def test_resumed_search_matches_full_search(ordering, tmp_path):
+    expected, finished = generate_all_lineups(*search_inputs(), ordering=ordering)
+    assert finished
+
+    checkpoint_file = str(tmp_path / "search.ckpt")
+    pauses = 0
+    finished = False
+    while not finished:
+        lineups, finished = generate_all_lineups(*search_inputs(), ordering=ordering, 
+                                                 node_limit=200, checkpoint_file=checkpoint_file)
+        pauses += 1
+    assert pauses > 1
+    assert lineups == expected
+
+def test_checkpoint_for_different_search_is_rejected(tmp_path):
+    checkpoint_file = str(tmp_path / "search.ckpt")
+    generate_all_lineups(*search_inputs(), node_limit=10, checkpoint_file=checkpoint_file)
+    with pytest.raises(ValueError):
+        generate_all_lineups(*search_inputs(), ordering="best_first", checkpoint_file=checkpoint_file)
+
+def test_paused_solve_resumes(tmp_path):
+    rankings = synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_24"])
+    expected, _, _ = solve_lineup(rankings, 3, 3, "male")
+
+    checkpoint_file = str(tmp_path / "solve.ckpt")
+    complete_lineup = {}
+    solves = 0
+    while "C Team" not in complete_lineup:
+        complete_lineup, _, _ = solve_lineup(rankings, 3, 3, "male", node_limit=500, checkpoint_file=checkpoint_file)
+        solves += 1
+    assert solves > 1
+    assert complete_lineup == expected
+
+def test_best_first_with_node_limit_is_no_worse_than_dfs():
+    # caps left over from a first meet under a season cap of 4 keep most swimmers over their limit
+    rankings = synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_24"])
+    _, total_event_indices, _ = solve_lineup(rankings, 3, 3, "male")
+    caps = {swimmer: 4 - len(events) for swimmer, events in total_event_indices.items()}
+
+    points = {}
+    for ordering in SEARCH_ORDERINGS:
+        complete_lineup, _, _ = solve_lineup(rankings, 1, 3, "male", caps, engine=ordering, node_limit=1000)
+        assert "A Team" in complete_lineup, ordering
+        points[ordering] = complete_lineup["A Team"]["Average Points Per Relay"]
+    assert points["best_first"] >= points["dfs"]
+
+def test_solve_reports_stopped_searches():
+    rankings = synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_24"])
+    _, _, searches_finished = solve_lineup(rankings, 3, 3, "male")
+    assert all(searches_finished.values())
+    _, _, searches_finished = solve_lineup(rankings, 3, 3, "male", node_limit=10)
+    assert not searches_finished["A Team"]
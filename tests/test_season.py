@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from rosters import SYNTHETIC_ROSTERS, synthetic_rankings
+from season import Meet, load_schedule, plan_season, solve_meet
+
+SCHEDULE = [
+    Meet("Dual", ("Swimmer 00",), False),
+    Meet("Invite", ("Swimmer 01",)),
+    Meet("Conference"),
+    Meet("Championships"),
+]
+SEASON_RELAYS_PER_SWIMMER = 6
+
+def swimmers_at(complete_lineup: dict) -> set[str]:
+    names = set()
+    for team_name, team in complete_lineup.items():
+        if not isinstance(team, dict):
+            continue
+        for relay_team in team["Lineup"].values():
+            names.update(leg[0] for leg in relay_team)
+    return names
+
+@pytest.fixture(scope="module")
+def rankings():
+    return synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_24"])
+
+@pytest.fixture(scope="module")
+def report(rankings):
+    return plan_season(SCHEDULE, rankings, 3, 3, "male", SEASON_RELAYS_PER_SWIMMER, max_workers=2)
+
+def test_unavailable_swimmer_is_left_out(report):
+    assert "Swimmer 00" not in swimmers_at(report["Meets"]["Dual"])
+    assert "Swimmer 01" not in swimmers_at(report["Meets"]["Invite"])
+
+def test_season_cap_holds_across_capped_meets(report):
+    capped_relays = {}
+    for swimmer, relays in report["Season Relays"].items():
+        capped_relays[swimmer] = sum(
+            len(events) for meet_name, events in relays["Meets"].items() if meet_name != "Dual")
+    assert max(capped_relays.values()) == SEASON_RELAYS_PER_SWIMMER
+
+def test_uncapped_meet_is_solved_independently(rankings, report):
+    _, complete_lineup, _, _ = solve_meet(SCHEDULE[0], rankings, 3, 3, "male")
+    assert report["Meets"]["Dual"] == complete_lineup
+
+def test_searches_run_to_the_end_by_default(report):
+    for meet in SCHEDULE:
+        assert all(report["Searches Finished"][meet.name].values()), meet.name
+
+def test_stopped_searches_are_reported(rankings):
+    # a season cap just above the per-meet limit leaves most swimmers with one relay at the
+    # second meet, which takes far more combinations to search than the first
+    schedule = [Meet("Invite"), Meet("Conference")]
+    report = plan_season(schedule, rankings, 3, 3, "male", 4, max_workers=1, node_limit=500)
+    assert not all(report["Searches Finished"]["Conference"].values())
+    assert "A Team" in report["Meets"]["Conference"]
+
+def test_duplicate_meet_names_are_rejected(rankings, tmp_path):
+    file_name = tmp_path / "schedule.json"
+    file_name.write_text(json.dumps([{"name": "Dual"}, {"name": "Dual", "counts_toward_cap": False}]))
+    with pytest.raises(ValueError):
+        load_schedule(str(file_name))
+    with pytest.raises(ValueError):
+        plan_season([Meet("Dual"), Meet("Dual")], rankings, 3, 3, "male", 4)
@@ -0,0 +1,42 @@
+import json, os, struct, subprocess, sys
+
+from main import INDIVIDUAL_EVENTS, SwimmerTime
+from rosters import ROOT, SYNTHETIC_ROSTERS, synthetic_rankings
+from snapshot import _float32_view, _uint32_view, load_snapshot, write_snapshot
+
+def test_snapshot_round_trip(tmp_path):
+    all_rankings = synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_40"])
+    file_name = str(tmp_path / "roster.snap")
+    write_snapshot(all_rankings, file_name)
+    assert load_snapshot(file_name) == all_rankings
+
+def test_snapshot_matches_golden_rankings(tmp_path):
+    with open(os.path.join(ROOT, "tests", "golden", "rankings_female.json"), 'r') as f:
+        golden = json.load(f)
+    all_rankings = {event: [SwimmerTime(*swimmer_time) for swimmer_time in rankings] 
+                    for event, rankings in golden.items()}
+    file_name = str(tmp_path / "roster.snap")
+    write_snapshot(all_rankings, file_name)
+    loaded = load_snapshot(file_name)
+    assert list(loaded.keys()) == INDIVIDUAL_EVENTS
+    assert loaded == all_rankings
+
+def test_views_swap_bytes_on_other_byte_order(monkeypatch):
+    # pretend the host has the other byte order, so values packed in the real host's opposite
+    # order are foreign to the file format and must be swapped back
+    other_order = "big" if sys.byteorder == "little" else "little"
+    prefix = ">" if sys.byteorder == "little" else "<"
+    monkeypatch.setattr(sys, "byteorder", other_order)
+    buffer = memoryview(struct.pack(f"{prefix}3I3f", 1, 2, 300, 20.5, 21.25, 100.0))
+    assert list(_uint32_view(buffer, 0, 3)) == [1, 2, 300]
+    assert list(_float32_view(buffer, 12, 3)) == [20.5, 21.25, 100.0]
+
+def test_loading_snapshot_does_not_import_pypdf2(tmp_path):
+    file_name = str(tmp_path / "roster.snap")
+    write_snapshot(synthetic_rankings(*SYNTHETIC_ROSTERS["synthetic_24"]), file_name)
+    # a fresh interpreter, so modules imported by other tests don't count
+    code = ("import sys, main, snapshot\n"
+            f"assert len(snapshot.load_snapshot({file_name!r})) > 0\n"
+            "assert 'PyPDF2' not in sys.modules, 'PyPDF2 was imported'\n")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
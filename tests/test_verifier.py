@@ -0,0 +1,91 @@
+import copy, json, os
+
+import pytest
+
+from main import RELAY_EVENTS, TEAM_NAMES, SwimmerTime
+from rosters import ROOT
+from verifier import verify_lineup, verify_lineup_files
+
+GENDERS = ["male", "female"]
+
+def golden_rankings(gender: str) -> dict[str, list[SwimmerTime]]:
+    with open(os.path.join(ROOT, "tests", "golden", f"rankings_{gender}.json"), 'r') as f:
+        return {event: [SwimmerTime(*entry) for entry in rankings] for event, rankings in json.load(f).items()}
+
+@pytest.fixture
+def rankings():
+    return golden_rankings("male")
+
+@pytest.fixture
+def teams():
+    with open(os.path.join(ROOT, "lineup_3_rpe_3_rps_male.json"), 'r') as f:
+        data = json.load(f)
+    return copy.deepcopy({team_name: data[team_name]["Lineup"] for team_name in TEAM_NAMES.values()
+                          if team_name in data.keys()})
+
+def assert_violation(violations: list[str], message: str):
+    assert any(message in violation for violation in violations), violations
+
+def test_committed_lineups_are_valid():
+    results = verify_lineup_files(os.path.join(ROOT, "lineup_*_rpe_*_rps_*.json"),
+                                  {gender: golden_rankings(gender) for gender in GENDERS})
+    assert len(results) > 0
+    for file_name, violations in results.items():
+        assert violations == [], file_name
+
+def test_lineup_without_rankings_is_not_valid():
+    results = verify_lineup_files(os.path.join(ROOT, "lineup_*_rpe_*_rps_male.json"))
+    for violations in results.values():
+        assert_violation(violations, "Leg strokes were not checked")
+
+def test_over_relay_cap(teams, rankings):
+    assert_violation(verify_lineup(teams, 2, rankings), "more than 2")
+
+def test_duplicate_leg(teams, rankings):
+    relay_team = teams["A Team"]["4x50fr"]
+    relay_team[1] = relay_team[0]
+    assert_violation(verify_lineup(teams, 3, rankings), "swims multiple legs of A Team 4x50fr")
+
+def test_same_relay_on_two_teams(teams, rankings):
+    teams["B Team"]["4x50fr"][0] = teams["A Team"]["4x50fr"][0]
+    assert_violation(verify_lineup(teams, 3, rankings), "is on multiple 4x50fr teams")
+
+def test_wrong_stroke_leg(teams, rankings):
+    relay_team = teams["A Team"]["4x50mr"]
+    relay_team[0], relay_team[1] = relay_team[1], relay_team[0]
+    violations = verify_lineup(teams, 3, rankings)
+    assert_violation(violations, f"{relay_team[0][0]} has no 50ba time for A Team 4x50mr")
+    assert verify_lineup(teams, 3) == []
+
+def test_previous_assigned_events_conflict(teams, rankings):
+    name = teams["A Team"]["4x50fr"][0][0]
+    previous_assigned_events = {name: [RELAY_EVENTS.index("4x50fr")]}
+    violations = verify_lineup(teams, 3, rankings, previous_assigned_events=previous_assigned_events)
+    assert_violation(violations, f"{name} already swam 4x50fr on a previous team")
+
+def write_mixed_lineup(tmp_path, data: dict) -> str:
+    file_name = tmp_path / "lineup_3_rpe_3_rps_mixed.json"
+    file_name.write_text(json.dumps(data))
+    return str(tmp_path / "lineup_*_rpe_*_rps_*.json")
+
+@pytest.fixture
+def mixed_lineup():
+    with open(os.path.join(ROOT, "tests", "golden", "lineup_3_rpe_3_rps_mixed.json"), 'r') as f:
+        return json.load(f)
+
+def test_mixed_lineup_is_valid(mixed_lineup, tmp_path):
+    pattern = write_mixed_lineup(tmp_path, mixed_lineup)
+    results = verify_lineup_files(pattern, {gender: golden_rankings(gender) for gender in GENDERS})
+    assert list(results.values()) == [[]]
+
+def test_mixed_relay_gender_split(mixed_lineup, tmp_path):
+    relay_team = mixed_lineup["A Team"]["Lineup"]["4x50xfr"]
+    male_names = {name for name, _ in golden_rankings("male")["50fr"]}
+    relay_names = {name for name, _ in relay_team}
+    female_swimmer = next(swimmer_time for swimmer_time in golden_rankings("female")["50fr"]
+                          if swimmer_time.name not in relay_names)
+    leg = next(i for i, (name, _) in enumerate(relay_team) if name in male_names)
+    relay_team[leg] = list(female_swimmer)
+    pattern = write_mixed_lineup(tmp_path, mixed_lineup)
+    results = verify_lineup_files(pattern, {gender: golden_rankings(gender) for gender in GENDERS})
+    assert_violation(list(results.values())[0], "A Team 4x50xfr does not have 2 swimmers of each gender")
@@ -0,0 +1,294 @@
+import json, glob
+from collections import defaultdict
+
+from main import (
+    RELAY_EVENTS,
+    MIXED_RELAY_EVENTS,
+    SWIMMERS_PER_GENDER,
+    FREE_RELAYS,
+    MEDLEY_RELAY_INDIVIDUAL_EVENTS,
+    TEAM_NAMES,
+    SwimmerTime,
+    extract_all_rankings,
+    merge_rankings,
+)
+
+# times are rounded to hundredths when parsed, so anything smaller is float noise
+TIME_TOLERANCE = 0.005
+
+def relay_leg_events(relay_name: str) -> list[str]:
+    '''
+    Returns the individual event that each leg of ``relay_name`` is ranked by.
+    '''
+    if relay_name in FREE_RELAYS.keys():
+        return [FREE_RELAYS[relay_name]] * 4
+    return MEDLEY_RELAY_INDIVIDUAL_EVENTS[relay_name]
+
+def build_ranking_index(all_rankings: dict[str, list[SwimmerTime]]) -> dict[str, dict[str, float]]:
+    '''
+    Returns a dictionary mapping each individual event to a dictionary of swimmer name to time.
+    '''
+    ranking_index = {}
+    for event, rankings in all_rankings.items():
+        event_index = {}
+        for name, time in rankings:
+            # rankings are ordered fastest first, keep the best time
+            if name not in event_index:
+                event_index[name] = time
+        ranking_index[event] = event_index
+    return ranking_index
+
+def build_lineup_indexes(teams: dict[str, dict[str, list]]
+                         ) -> tuple[dict[str, list[tuple[str, str]]], dict[tuple[str, str], list[str]]]:
+    '''
+    Builds the indexes used by ``verify_lineup`` in a single pass over the lineup.
+
+    Parameters
+    ----------
+    teams : dict
+        key : team name (e.g. "A Team")
+        value : dict
+            key : relay event
+            value : array of 4 legs, each a ``SwimmerTime`` or a (name, time) pair
+
+    Returns
+    -------
+    swimmer_relays : dict
+        key : swimmer name
+        value : array of (team name, relay event) tuples the swimmer is part of
+
+    relay_swimmers : dict
+        key : (team name, relay event)
+        value : array of swimmer names in leg order, with ``None`` for empty legs
+    '''
+    swimmer_relays = defaultdict(list)
+    relay_swimmers = {}
+    for team_name, relay_teams in teams.items():
+        for relay_name, relay_team in relay_teams.items():
+            names = []
+            for leg in relay_team:
+                if leg is None:
+                    names.append(None)
+                    continue
+                name = leg[0]
+                names.append(name)
+                swimmer_relays[name].append((team_name, relay_name))
+            relay_swimmers[(team_name, relay_name)] = names
+    return swimmer_relays, relay_swimmers
+
+def verify_lineup(teams: dict[str, dict[str, list]],
+                  relays_per_swimmer: int,
+                  all_rankings: dict[str, list[SwimmerTime]] = None,
+                  swimmer_event_limits: dict[str, int] = None,
+                  previous_assigned_events: dict[str, list[int]] = None,
+                  swimmer_genders: dict[str, str] = None
+                  ) -> list[str]:
+    '''
+    Checks a lineup against the relay constraints and returns a list of violations.
+    An empty list means the lineup is valid. Runs in time linear in the size of the
+    lineup and the rankings.
+
+    The following constraints are checked:
+        * every relay has 4 legs filled
+        * no swimmer swims more than their relay limit
+        * no swimmer swims two legs of the same relay
+        * no swimmer is on two teams of the same relay event
+        * every leg's time matches the swimmer's time for the leg's stroke,
+          if ``all_rankings`` is given
+        * every mixed relay has ``SWIMMERS_PER_GENDER`` swimmers of each gender,
+          if ``swimmer_genders`` is given
+
+    Parameters
+    ----------
+    teams : dict
+        The lineup for each team. See ``build_lineup_indexes`` for details.
+
+    relays_per_swimmer : int
+        The maximum number of relays each swimmer can swim.
+
+    all_rankings : dict, optional
+        key : event name
+        value : array of tuples with rankings
+        The rankings the lineup was generated from.
+
+    swimmer_event_limits : dict, optional
+        key : swimmer name
+        value : the number of relays the swimmer has left
+        Overrides ``relays_per_swimmer`` for individual swimmers.
+
+    previous_assigned_events : dict, optional
+        key : swimmer name
+        value : array of indices of the relays the swimmer swam on a previous team
+        Swimmers cannot swim these relays again.
+
+    swimmer_genders : dict, optional
+        key : swimmer name
+        value : the swimmer's gender
+    '''
+    if swimmer_event_limits is None:
+        swimmer_event_limits = {}
+    if previous_assigned_events is None:
+        previous_assigned_events = {}
+
+    violations = []
+    swimmer_relays, relay_swimmers = build_lineup_indexes(teams)
+
+    for name, relays in swimmer_relays.items():
+        limit = swimmer_event_limits[name] if name in swimmer_event_limits.keys() else relays_per_swimmer
+        if len(relays) > limit:
+            violations.append(f"{name} set to swim {len(relays)} relays, more than {limit}.")
+
+        teams_per_relay = defaultdict(set)
+        for team_name, relay_name in relays:
+            teams_per_relay[relay_name].add(team_name)
+        for relay_name, team_names in teams_per_relay.items():
+            if len(team_names) > 1:
+                violations.append(f"{name} is on multiple {relay_name} teams: {', '.join(sorted(team_names))}.")
+
+        for event_index in previous_assigned_events.get(name, []):
+            relay_name = RELAY_EVENTS[event_index]
+            if relay_name in teams_per_relay:
+                violations.append(f"{name} already swam {relay_name} on a previous team.")
+
+    for (team_name, relay_name), names in relay_swimmers.items():
+        if None in names or len(names) != 4:
+            violations.append(f"{team_name} {relay_name} does not have 4 swimmers.")
+        seen = set()
+        for name in names:
+            if name is None:
+                continue
+            if name in seen:
+                violations.append(f"{name} swims multiple legs of {team_name} {relay_name}.")
+            seen.add(name)
+        if swimmer_genders is not None and relay_name in MIXED_RELAY_EVENTS:
+            gender_counts = defaultdict(int)
+            for name in names:
+                if name is not None:
+                    gender_counts[swimmer_genders.get(name)] += 1
+            if any(count != SWIMMERS_PER_GENDER for count in gender_counts.values()):
+                violations.append(f"{team_name} {relay_name} does not have {SWIMMERS_PER_GENDER} swimmers of each gender.")
+
+    if all_rankings is not None:
+        ranking_index = build_ranking_index(all_rankings)
+        for team_name, relay_teams in teams.items():
+            for relay_name, relay_team in relay_teams.items():
+                for leg, individual_event in zip(relay_team, relay_leg_events(relay_name)):
+                    if leg is None:
+                        continue
+                    name, time = leg[0], leg[1]
+                    event_index = ranking_index.get(individual_event, {})
+                    if name not in event_index:
+                        violations.append(f"{name} has no {individual_event} time for {team_name} {relay_name}.")
+                    elif abs(event_index[name] - time) > TIME_TOLERANCE:
+                        violations.append(
+                            f"{name}'s {team_name} {relay_name} leg is {time}, "
+                            f"but their {individual_event} time is {event_index[name]}.")
+
+    return violations
+
+def assert_valid_lineup(teams: dict[str, dict[str, list]],
+                        relays_per_swimmer: int,
+                        all_rankings: dict[str, list[SwimmerTime]] = None,
+                        swimmer_event_limits: dict[str, int] = None,
+                        previous_assigned_events: dict[str, list[int]] = None,
+                        swimmer_genders: dict[str, str] = None):
+    '''
+    Raises an ``AssertionError`` listing every violation if the lineup is invalid.
+    See ``verify_lineup`` for details.
+    '''
+    violations = verify_lineup(teams, relays_per_swimmer, all_rankings,
+                               swimmer_event_limits, previous_assigned_events, swimmer_genders)
+    assert len(violations) == 0, "Invalid lineup:\n" + "\n".join(violations)
+
+def verify_lineup_file(file_name: str,
+                       all_rankings: dict[str, list[SwimmerTime]] = None,
+                       swimmer_genders: dict[str, str] = None) -> list[str]:
+    '''
+    Verifies a lineup json file written by ``generate_best_lineup`` or ``generate_best_mixed_lineup``.
+    Mixed lineups need the merged rankings and swimmer genders from ``merge_rankings``.
+    '''
+    with open(file_name, 'r') as f:
+        data = json.load(f)
+    relays_per_swimmer = data["Maximum Relays Per Swimmer"]
+    teams = {}
+    for team_name in TEAM_NAMES.values():
+        if team_name not in data.keys():
+            continue
+        teams[team_name] = data[team_name]["Lineup"]
+    return verify_lineup(teams, relays_per_swimmer, all_rankings, swimmer_genders=swimmer_genders)
+
+def verify_lineup_files(pattern: str = "lineup_*_rpe_*_rps_*.json",
+                        rankings_by_gender: dict[str, dict[str, list[SwimmerTime]]] = None
+                        ) -> dict[str, list[str]]:
+    '''
+    Verifies every lineup file matching ``pattern``, e.g. all lineups written by a sweep
+    over relay limits.
+
+    Parameters
+    ----------
+    pattern : str
+        A glob pattern for the lineup files.
+
+    rankings_by_gender : dict, optional
+        key : gender
+        value : the rankings for that gender. See ``extract_all_rankings``.
+        Mixed files are checked against the men's and women's rankings merged by
+        ``merge_rankings``, including the gender split of each mixed relay.
+        Files whose gender has no rankings cannot have their leg strokes checked,
+        so they are reported with a violation saying so.
+
+    Returns
+    -------
+    results : dict
+        key : file name
+        value : the violations found in the file
+    '''
+    if rankings_by_gender is None:
+        rankings_by_gender = {}
+    rankings_by_gender = {gender: all_rankings for gender, all_rankings in rankings_by_gender.items()
+                          if gender != "mixed"}
+    swimmer_genders = None
+    if "male" in rankings_by_gender.keys() and "female" in rankings_by_gender.keys():
+        rankings_by_gender["mixed"], swimmer_genders = merge_rankings(
+            rankings_by_gender["male"], rankings_by_gender["female"])
+    results = {}
+    for file_name in sorted(glob.glob(pattern)):
+        gender = file_name[file_name.rindex('_') + 1:-len(".json")]
+        all_rankings = rankings_by_gender.get(gender)
+        violations = verify_lineup_file(file_name, all_rankings,
+                                        swimmer_genders if gender == "mixed" else None)
+        if all_rankings is None:
+            violations.append(f"Leg strokes were not checked: no {gender} rankings.")
+        results[file_name] = violations
+    return results
+
+def load_rankings(school_name: str, gender: str) -> dict[str, list[SwimmerTime]]:
+    '''
+    Parses the top times pdfs for ``gender``, or returns ``None`` if they cannot be read.
+    '''
+    try:
+        return extract_all_rankings(school_name, gender, write=False)
+    except (ImportError, OSError) as e:
+        print(f"Could not read the {gender} rankings: {e}")
+        return None
+
+def main():
+    school_name = "California Institute of Technology"
+    rankings_by_gender = {}
+    for gender in ["male", "female"]:
+        all_rankings = load_rankings(school_name, gender)
+        if all_rankings is not None:
+            rankings_by_gender[gender] = all_rankings
+    all_valid = True
+    for file_name, violations in verify_lineup_files(rankings_by_gender=rankings_by_gender).items():
+        if len(violations) == 0:
+            print(f"{file_name}: valid.")
+            continue
+        all_valid = False
+        print(f"{file_name}: {len(violations)} violations.")
+        for violation in violations:
+            print(f"  {violation}")
+    return 0 if all_valid else 1
+
+if __name__=="__main__":
+    raise SystemExit(main())